@@ -0,0 +1,26 @@
+# intent/__main__.py
+from __future__ import annotations
+
+import sys
+
+
+def main() -> None:
+    """
+    Console entry point.
+
+    A bare `intent --version` is answered here, before the Typer app (and click)
+    is imported; everything else is dispatched to intent.cli.
+    """
+    if sys.argv[1:] == ["--version"]:
+        from . import __version__
+
+        sys.stdout.write(f"{__version__}\n")
+        return
+
+    from .cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,27 @@
 # intent/cli.py
 from __future__ import annotations
 
-import json
+import operator
+import os
 import re
-import subprocess
+import sys
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Annotated, Literal, NoReturn, Self
 
 import typer
 
 from . import __version__
-from .config import CheckAssertion, CheckGate, CiSummaryMetric, IntentConfigError, load_intent
-from .fs import GENERATED_MARKER, OwnershipError, write_generated_file
+from .fs import (
+    GENERATED_MARKER,
+    OwnershipError,
+    atomic_write_text,
+    read_file_bytes,
+    write_generated_file,
+)
 from .pyproject_reader import PyprojectPythonStatus, read_pyproject_python
-from .render_ci import render_ci
-from .render_just import render_just
 from .versioning import (
     check_requires_python_range,
     max_lower_bound,
@@ -22,6 +29,12 @@ from .versioning import (
     parse_pep440_version,
 )
 
+if TYPE_CHECKING:
+    import subprocess
+    from collections.abc import Callable, Iterable
+
+    from .config import CheckAssertion, CheckGate, CiSummaryMetric
+
 app = typer.Typer(help="Intent CLI", invoke_without_command=True)
 
 ERR_USAGE_CONFLICT = "INTENT001"
@@ -37,6 +50,107 @@ ERR_PLUGIN = "INTENT301"
 ERR_CHECK = "INTENT401"
 ERR_LINT = "INTENT501"
 
+_CONFIG_NOT_FOUND_PREFIX = f"[{ERR_CONFIG_NOT_FOUND}] Error: "
+_CONFIG_INVALID_PREFIX = f"[{ERR_CONFIG_INVALID}] Config error: "
+_USAGE_CONFLICT_PREFIX = f"[{ERR_USAGE_CONFLICT}] Error: "
+_SYNC_WRITE_HINT = "\nHint: run `intent sync --write` to update generated files."
+
+_SPEC_OPERATOR_RE = re.compile(r"[<>,=]")
+_PLAIN_VERSION_RE = re.compile(r"[0-9]+(?:\.[0-9]+)*")
+_JSON_PATH_KEY_RE = re.compile(r"[A-Za-z0-9_-]+")
+_JSON_PATH_INDEX_RE = re.compile(r"\[(\d+)\]")
+_TOOL_VERSIONS_PYTHON_RE = re.compile(r"^[ \t]*python[ \t]+\S[^\r\n]*", re.MULTILINE)
+_COMPARE_OPS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+_SHELL_SYNTAX_RE = re.compile(r"[|&;<>()$`\\\"'*?\[\]{}~#!\n]")
+# Whitespace other than space/tab (\r, \v, \f, NBSP, ...) is literal to sh but split by str.split().
+_NON_BLANK_SPACE_RE = re.compile(r"[^\S \t]")
+# POSIX special and regular builtins plus common bash/dash ones; these never go direct.
+_SHELL_BUILTINS = frozenset(
+    {
+        ".",
+        ":",
+        "alias",
+        "bg",
+        "break",
+        "builtin",
+        "cd",
+        "command",
+        "continue",
+        "declare",
+        "echo",
+        "eval",
+        "exec",
+        "exit",
+        "export",
+        "false",
+        "fc",
+        "fg",
+        "getopts",
+        "hash",
+        "jobs",
+        "kill",
+        "let",
+        "local",
+        "printf",
+        "pwd",
+        "read",
+        "readonly",
+        "return",
+        "set",
+        "shift",
+        "source",
+        "test",
+        "times",
+        "trap",
+        "true",
+        "type",
+        "typeset",
+        "ulimit",
+        "umask",
+        "unalias",
+        "unset",
+        "wait",
+    }
+)
+_GENERATED_MARKER_BYTES = GENERATED_MARKER.encode("utf-8")
+_CI_PATH = Path(".github/workflows/ci.yml")
+_JUST_PATH = Path("justfile")
+_PYPROJECT_PATH = Path("pyproject.toml")
+_PYTHON_VERSION_PATH = Path(".python-version")
+_TOOL_VERSIONS_PATH = Path(".tool-versions")
+_SUMMARY_METRICS_HEADER = (
+    "### Metrics",
+    "",
+    "| Metric | Value | Baseline | Delta |",
+    "| --- | ---: | ---: | ---: |",
+)
+
+
+@lru_cache(maxsize=8)
+def _marks_for_encoding(encoding: str) -> tuple[str, str]:
+    try:
+        "✓✗".encode(encoding)
+    except (LookupError, UnicodeEncodeError):
+        return "OK", "FAIL"
+    return "✓", "✗"
+
+
+def _status_marks() -> tuple[str, str]:
+    """Return the (ok, fail) line prefixes, falling back to ASCII on non-UTF-8 stdout."""
+    return _marks_for_encoding(getattr(sys.stdout, "encoding", None) or "utf-8")
+
+
+class OutputFormat(str, Enum):
+    TEXT = "text"
+    JSON = "json"
+
 
 @app.callback()
 def _root(
@@ -52,39 +166,174 @@ def _root(
         raise typer.Exit(code=0)
 
 
-def _preview_status(path: Path, new_content: str) -> str:
-    if not path.exists():
+class _EchoBuffer:
+    """
+    Collect CLI output and emit it with one echo per contiguous stdout/stderr run.
+    """
+
+    def __init__(self) -> None:
+        self._runs: list[tuple[bool, list[str]]] = []
+
+    def echo(self, message: str = "", err: bool = False) -> None:
+        if self._runs and self._runs[-1][0] == err:
+            self._runs[-1][1].append(message)
+        else:
+            self._runs.append((err, [message]))
+
+    def extend(self, messages: Iterable[str], err: bool = False) -> None:
+        messages = list(messages)
+        if not messages:
+            return
+        if self._runs and self._runs[-1][0] == err:
+            self._runs[-1][1].extend(messages)
+        else:
+            self._runs.append((err, messages))
+
+    def flush(self) -> None:
+        for err, lines in self._runs:
+            typer.echo("\n".join(lines), err=err)
+        self._runs.clear()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
+
+
+def _echo_json(payload: object) -> None:
+    """Write a JSON document line straight to stdout's binary buffer when there is one."""
+    from .jsonio import dumps_bytes
+
+    data = dumps_bytes(payload) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        typer.echo(data.decode("ascii"), nl=False)
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _read_if_exists(path: Path) -> bytes | None:
+    try:
+        data = read_file_bytes(path)
+    except FileNotFoundError:
+        return None
+    if b"\r" in data:
+        # Keep read_text()'s universal-newline behavior for CRLF checkouts.
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data
+
+
+def _preview_status(path: Path, new_content: str, existing: bytes | None) -> str:
+    if existing is None:
         return f"Would write {path}"
 
-    existing = path.read_text(encoding="utf-8")
-    if GENERATED_MARKER not in existing:
-        return f"Cannot update {path}: exists but is not tool-owned (missing marker)"
-    if existing == new_content:
+    # Rendered content always carries the marker, so an exact match is tool-owned.
+    if existing == new_content.encode("utf-8"):
         return f"No changes to {path}"
+    if _GENERATED_MARKER_BYTES not in existing:
+        return f"Cannot update {path}: exists but is not tool-owned (missing marker)"
     return f"Would update {path}"
 
 
-def _generated_drift_status(path: Path, new_content: str) -> tuple[bool, str, str | None]:
-    if not path.exists():
+def _generated_drift_status(
+    path: Path, new_content: str, existing: bytes | None
+) -> tuple[bool, str, str | None]:
+    if existing is None:
         return False, f"{path} is missing", ERR_FILE_MISSING
 
-    existing = path.read_text(encoding="utf-8")
-    if GENERATED_MARKER not in existing:
+    if existing == new_content.encode("utf-8"):
+        return True, f"{path} is up to date", None
+    if _GENERATED_MARKER_BYTES not in existing:
         return False, f"{path} exists but is not tool-owned (missing marker)", ERR_FILE_UNOWNED
-    if existing != new_content:
-        return False, f"{path} is out of date", ERR_FILE_OUTDATED
-    return True, f"{path} is up to date", None
+    return False, f"{path} is out of date", ERR_FILE_OUTDATED
 
 
-def _run_plugin_hooks(hooks: list[str] | None, stage: str) -> list[dict]:
-    results: list[dict] = []
-    for command in hooks or []:
-        proc = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
+def _emit_config_error(error: Exception, code: str, output_format: OutputFormat) -> NoReturn:
+    if output_format is OutputFormat.JSON:
+        payload = {"ok": False, "error": {"kind": "config", "message": f"{error}"}, "code": code}
+        _echo_json(payload)
+    else:
+        prefix = (
+            _CONFIG_NOT_FOUND_PREFIX if code == ERR_CONFIG_NOT_FOUND else _CONFIG_INVALID_PREFIX
         )
+        typer.echo(prefix + str(error), err=True)
+    raise typer.Exit(code=2)
+
+
+def _write_generated_if_changed(
+    path: Path, new_content: str, mode: Literal["strict", "adopt", "force"]
+) -> bool:
+    up_to_date, _, _ = _generated_drift_status(path, new_content, _read_if_exists(path))
+    if up_to_date:
+        return False
+    return write_generated_file(path, new_content, mode=mode)
+
+
+def _needs_shell(command: str) -> bool:
+    if (
+        os.name != "posix"
+        or _SHELL_SYNTAX_RE.search(command)
+        or _NON_BLANK_SPACE_RE.search(command)
+    ):
+        return True
+    first_word = command.split(None, 1)[0] if command.strip() else ""
+    return not first_word or first_word in _SHELL_BUILTINS or "=" in first_word
+
+
+def _run_shell(command: str, text: bool = True) -> subprocess.CompletedProcess:
+    """
+    Run a configured command, skipping the /bin/sh wrapper for plain argv commands.
+
+    Anything with shell syntax, a leading builtin, an env assignment, or a program
+    that is not found on PATH still goes through the shell, as does a direct exec
+    the kernel rejects (e.g. a script without a shebang), so results match
+    shell=True. With text=False, stdout and stderr are returned as raw bytes.
+    """
+    import shutil
+    import subprocess
+
+    if not _needs_shell(command):
+        # Only space/tab separators and no quotes, escapes or expansions reach here,
+        # so split() matches sh's field splitting.
+        argv = command.split()
+        if shutil.which(argv[0]) is not None:
+            try:
+                return subprocess.run(
+                    argv,
+                    capture_output=True,
+                    text=text,
+                )
+            except OSError:
+                pass
+
+    return subprocess.run(
+        command,
+        shell=True,
+        capture_output=True,
+        text=text,
+    )
+
+
+def _run_shell_many(
+    commands: list[str], parallel: bool, text: bool = True
+) -> list[subprocess.CompletedProcess]:
+    """Run commands and return their results in input order."""
+    if not parallel or len(commands) < 2:
+        return [_run_shell(command, text) for command in commands]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(commands), os.cpu_count() or 4)) as pool:
+        return list(pool.map(lambda command: _run_shell(command, text), commands))
+
+
+def _run_plugin_hooks(hooks: list[str] | None, stage: str, parallel: bool = False) -> list[dict]:
+    commands = hooks or []
+    results: list[dict] = []
+    for command, proc in zip(commands, _run_shell_many(commands, parallel)):
         results.append(
             {
                 "stage": stage,
@@ -99,18 +348,19 @@ def _run_plugin_hooks(hooks: list[str] | None, stage: str) -> list[dict]:
     return results
 
 
-def _run_json_commands(commands: dict[str, str], command_names: set[str]) -> dict[str, dict]:
+def _run_json_commands(
+    commands: dict[str, str], command_names: Iterable[str], parallel: bool = False
+) -> dict[str, dict]:
+    from .jsonio import JSONDecodeError, loads
+
+    names = list(command_names)
+    # Capture bytes: the JSON parser decodes UTF-8 itself, so skip the text-mode pass.
+    procs = _run_shell_many([commands[name] for name in names], parallel, text=False)
     results: dict[str, dict] = {}
-    for command_name in sorted(command_names):
-        command = commands[command_name]
-        proc = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-        )
-        stdout = proc.stdout.strip()
-        stderr = proc.stderr.strip()
+    for command_name, proc in zip(names, procs):
+        raw_stdout = proc.stdout.strip()
+        stdout = raw_stdout.decode("utf-8", errors="replace")
+        stderr = proc.stderr.decode("utf-8", errors="replace").strip()
         if proc.returncode != 0:
             results[command_name] = {
                 "ok": False,
@@ -121,11 +371,12 @@ def _run_json_commands(commands: dict[str, str], command_names: set[str]) -> dic
             continue
 
         try:
-            payload = json.loads(stdout)
-        except json.JSONDecodeError as e:
+            payload = loads(raw_stdout)
+        except (JSONDecodeError, UnicodeDecodeError) as e:
+            msg = e.msg if isinstance(e, JSONDecodeError) else "invalid UTF-8"
             results[command_name] = {
                 "ok": False,
-                "error": f"stdout is not valid JSON: {e.msg}",
+                "error": f"stdout is not valid JSON: {msg}",
                 "stdout": stdout,
                 "stderr": stderr,
             }
@@ -140,7 +391,9 @@ def _run_json_commands(commands: dict[str, str], command_names: set[str]) -> dic
     return results
 
 
-def _json_path_tokens(path: str) -> list[str | int]:
+@lru_cache(maxsize=512)
+def _json_path_tokens(path: str) -> tuple[str | int, ...]:
+    """Tokenize a dotted JSON path; results are memoized since paths come from config."""
     tokens: list[str | int] = []
     if not path or not path.strip():
         raise ValueError("path cannot be empty")
@@ -148,21 +401,19 @@ def _json_path_tokens(path: str) -> list[str | int]:
     for part in path.split("."):
         if not part:
             raise ValueError(f"invalid path segment in {path!r}")
-        pos = 0
-        key_match = re.match(r"[A-Za-z0-9_-]+", part[pos:])
+        key_match = _JSON_PATH_KEY_RE.match(part)
         if not key_match:
             raise ValueError(f"invalid key segment in {path!r}")
-        key = key_match.group(0)
-        tokens.append(key)
-        pos += len(key)
+        tokens.append(key_match.group(0))
+        pos = key_match.end()
 
         while pos < len(part):
-            index_match = re.match(r"\[(\d+)\]", part[pos:])
+            index_match = _JSON_PATH_INDEX_RE.match(part, pos)
             if not index_match:
                 raise ValueError(f"invalid index segment in {path!r}")
             tokens.append(int(index_match.group(1)))
-            pos += len(index_match.group(0))
-    return tokens
+            pos = index_match.end()
+    return tuple(tokens)
 
 
 def _resolve_json_path(payload: object, path: str) -> tuple[bool, object | None, str | None]:
@@ -193,10 +444,12 @@ def _resolve_json_path(payload: object, path: str) -> tuple[bool, object | None,
 
 
 def _compare_assertion(actual: object, op: str, expected: object) -> tuple[bool, str | None]:
-    if op == "eq":
-        return actual == expected, None
-    if op == "ne":
-        return actual != expected, None
+    compare = _COMPARE_OPS.get(op)
+    if compare is not None:
+        try:
+            return compare(actual, expected), None
+        except TypeError:
+            return False, f"incompatible types for operator {op!r}"
 
     if op == "in":
         if not isinstance(expected, list):
@@ -207,18 +460,6 @@ def _compare_assertion(actual: object, op: str, expected: object) -> tuple[bool,
             return False, "expected array for 'not_in' operator"
         return actual not in expected, None
 
-    try:
-        if op == "gt":
-            return actual > expected, None
-        if op == "gte":
-            return actual >= expected, None
-        if op == "lt":
-            return actual < expected, None
-        if op == "lte":
-            return actual <= expected, None
-    except TypeError:
-        return False, f"incompatible types for operator {op!r}"
-
     return False, f"unsupported operator {op!r}"
 
 
@@ -232,7 +473,7 @@ def _run_check_assertions(
     results: list[dict] = []
     for assertion in assertions:
         command_result = command_results[assertion.command]
-        base = {
+        row = {
             "command": assertion.command,
             "path": assertion.path,
             "op": assertion.op,
@@ -241,45 +482,41 @@ def _run_check_assertions(
             "code": None,
         }
         if not command_result["ok"]:
-            results.append(
-                {
-                    **base,
-                    "ok": False,
-                    "actual": None,
-                    "reason": command_result["error"],
-                    "code": ERR_CHECK,
-                }
+            row.update(
+                ok=False,
+                actual=None,
+                reason=command_result["error"],
+                code=ERR_CHECK,
             )
+            results.append(row)
             continue
 
         found, actual, path_error = _resolve_json_path(command_result["payload"], assertion.path)
         if not found:
-            results.append(
-                {
-                    **base,
-                    "ok": False,
-                    "actual": None,
-                    "reason": path_error,
-                    "code": ERR_CHECK,
-                }
+            row.update(
+                ok=False,
+                actual=None,
+                reason=path_error,
+                code=ERR_CHECK,
             )
+            results.append(row)
             continue
 
         ok, compare_error = _compare_assertion(actual, assertion.op, assertion.value)
-        results.append(
-            {
-                **base,
-                "ok": ok,
-                "actual": actual,
-                "reason": compare_error if compare_error else None,
-                "code": None if ok else ERR_CHECK,
-            }
+        row.update(
+            ok=ok,
+            actual=actual,
+            reason=compare_error if compare_error else None,
+            code=None if ok else ERR_CHECK,
         )
+        results.append(row)
     return results
 
 
 def _is_number(value: object) -> bool:
-    return isinstance(value, (int, float)) and not isinstance(value, bool)
+    # Exact type check: JSON payloads only yield plain int/float, and bool is excluded.
+    value_type = type(value)
+    return value_type is int or value_type is float
 
 
 def _apply_precision(value: object, precision: int | None) -> object:
@@ -301,7 +538,7 @@ def _evaluate_summary_metrics(
     results: list[dict] = []
     for metric in metrics:
         command_result = command_results[metric.command]
-        base = {
+        row = {
             "label": metric.label,
             "command": metric.command,
             "path": metric.path,
@@ -310,33 +547,29 @@ def _evaluate_summary_metrics(
             "code": None,
         }
         if not command_result["ok"]:
-            results.append(
-                {
-                    **base,
-                    "ok": False,
-                    "value": None,
-                    "baseline": None,
-                    "delta": None,
-                    "reason": command_result["error"],
-                    "code": ERR_CHECK,
-                }
+            row.update(
+                ok=False,
+                value=None,
+                baseline=None,
+                delta=None,
+                reason=command_result["error"],
+                code=ERR_CHECK,
             )
+            results.append(row)
             continue
 
         payload = command_result["payload"]
         found_value, value, value_error = _resolve_json_path(payload, metric.path)
         if not found_value:
-            results.append(
-                {
-                    **base,
-                    "ok": False,
-                    "value": None,
-                    "baseline": None,
-                    "delta": None,
-                    "reason": value_error,
-                    "code": ERR_CHECK,
-                }
+            row.update(
+                ok=False,
+                value=None,
+                baseline=None,
+                delta=None,
+                reason=value_error,
+                code=ERR_CHECK,
             )
+            results.append(row)
             continue
 
         baseline = None
@@ -351,28 +584,24 @@ def _evaluate_summary_metrics(
                         baseline_unavailable_reason or "baseline source unavailable"
                     )
                     if baseline_on_missing == "skip":
-                        results.append(
-                            {
-                                **base,
-                                "ok": True,
-                                "value": _apply_precision(value, metric.precision),
-                                "baseline": None,
-                                "delta": None,
-                                "reason": unavailable_reason,
-                            }
+                        row.update(
+                            ok=True,
+                            value=_apply_precision(value, metric.precision),
+                            baseline=None,
+                            delta=None,
+                            reason=unavailable_reason,
                         )
+                        results.append(row)
                     else:
-                        results.append(
-                            {
-                                **base,
-                                "ok": False,
-                                "value": _apply_precision(value, metric.precision),
-                                "baseline": None,
-                                "delta": None,
-                                "reason": unavailable_reason,
-                                "code": ERR_CHECK,
-                            }
+                        row.update(
+                            ok=False,
+                            value=_apply_precision(value, metric.precision),
+                            baseline=None,
+                            delta=None,
+                            reason=unavailable_reason,
+                            code=ERR_CHECK,
                         )
+                        results.append(row)
                     continue
 
             found_baseline, baseline_value, baseline_error = _resolve_json_path(
@@ -380,28 +609,24 @@ def _evaluate_summary_metrics(
             )
             if not found_baseline:
                 if baseline_on_missing == "skip":
-                    results.append(
-                        {
-                            **base,
-                            "ok": True,
-                            "value": _apply_precision(value, metric.precision),
-                            "baseline": None,
-                            "delta": None,
-                            "reason": baseline_error,
-                        }
+                    row.update(
+                        ok=True,
+                        value=_apply_precision(value, metric.precision),
+                        baseline=None,
+                        delta=None,
+                        reason=baseline_error,
                     )
+                    results.append(row)
                 else:
-                    results.append(
-                        {
-                            **base,
-                            "ok": False,
-                            "value": _apply_precision(value, metric.precision),
-                            "baseline": None,
-                            "delta": None,
-                            "reason": baseline_error,
-                            "code": ERR_CHECK,
-                        }
+                    row.update(
+                        ok=False,
+                        value=_apply_precision(value, metric.precision),
+                        baseline=None,
+                        delta=None,
+                        reason=baseline_error,
+                        code=ERR_CHECK,
                     )
+                    results.append(row)
                 continue
             baseline = baseline_value
             if _is_number(value) and _is_number(baseline):
@@ -409,20 +634,20 @@ def _evaluate_summary_metrics(
             else:
                 reason = "delta requires numeric value and baseline"
 
-        results.append(
-            {
-                **base,
-                "ok": True,
-                "value": _apply_precision(value, metric.precision),
-                "baseline": _apply_precision(baseline, metric.precision),
-                "delta": _apply_precision(delta, metric.precision),
-                "reason": reason,
-            }
+        row.update(
+            ok=True,
+            value=_apply_precision(value, metric.precision),
+            baseline=_apply_precision(baseline, metric.precision),
+            delta=_apply_precision(delta, metric.precision),
+            reason=reason,
         )
+        results.append(row)
     return results
 
 
 def _load_summary_baseline(cfg: object) -> tuple[object | None, str | None, str, str]:
+    from .jsonio import JSONDecodeError, loads
+
     baseline_cfg = cfg.ci_summary.baseline if cfg.ci_summary else None
     if baseline_cfg is None:
         return None, None, "current", "fail"
@@ -431,20 +656,20 @@ def _load_summary_baseline(cfg: object) -> tuple[object | None, str | None, str,
 
     assert baseline_cfg.source == "file"
     baseline_file = Path(baseline_cfg.file or "")
-    if not baseline_file.exists():
+    try:
+        raw_text = baseline_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return (
             None,
             f"baseline source unavailable: {baseline_file} does not exist",
             "file",
             baseline_cfg.on_missing,
         )
-    try:
-        raw_text = baseline_file.read_text(encoding="utf-8")
     except OSError as e:
         return None, f"baseline source unavailable: {e}", "file", baseline_cfg.on_missing
     try:
-        payload = json.loads(raw_text)
-    except json.JSONDecodeError as e:
+        payload = loads(raw_text)
+    except JSONDecodeError as e:
         return (
             None,
             f"baseline source unavailable: invalid JSON in {baseline_file} ({e.msg})",
@@ -462,29 +687,25 @@ def _render_summary_markdown(
 ) -> str:
     lines = [f"## {title}", ""]
     if include_assertions:
-        total = len(assertions)
         passed = sum(1 for item in assertions if item["ok"])
-        failed = total - passed
-        lines.append("### Assertions")
-        lines.append("")
-        lines.append(f"- Passed: {passed}")
-        lines.append(f"- Failed: {failed}")
-        lines.append("")
+        failed = len(assertions) - passed
+        lines.extend(["### Assertions", "", f"- Passed: {passed}", f"- Failed: {failed}", ""])
     if metrics:
-        lines.append("### Metrics")
-        lines.append("")
-        lines.append("| Metric | Value | Baseline | Delta |")
-        lines.append("| --- | ---: | ---: | ---: |")
-        for metric in metrics:
-            value = metric["value"] if metric["value"] is not None else "-"
-            baseline = metric["baseline"] if metric["baseline"] is not None else "-"
-            delta = metric["delta"] if metric["delta"] is not None else "-"
-            lines.append(f"| {metric['label']} | {value} | {baseline} | {delta} |")
+        lines.extend(_SUMMARY_METRICS_HEADER)
+        lines.extend(
+            f"| {metric['label']} "
+            f"| {'-' if metric['value'] is None else metric['value']} "
+            f"| {'-' if metric['baseline'] is None else metric['baseline']} "
+            f"| {'-' if metric['delta'] is None else metric['delta']} |"
+            for metric in metrics
+        )
         lines.append("")
     return "\n".join(lines).rstrip()
 
 
 def _expand_gates_to_assertions(gates: list[CheckGate] | None) -> list[CheckAssertion]:
+    from .config import CheckAssertion
+
     expanded: list[CheckAssertion] = []
     for gate in gates or []:
         prefix = f"[gate:{gate.name}] " if gate.name else ""
@@ -662,21 +883,58 @@ def _sync_explain_payload(cfg: object) -> dict:
 
 
 def _print_sync_explain_text(cfg: object) -> None:
-    typer.echo("--- explain ---")
-    typer.echo(".github/workflows/ci.yml")
-    typer.echo("  renderer: render_ci")
-    typer.echo(
-        "  inputs: [python].version, [commands], [ci].install, [ci].cache, "
-        "[ci].python_versions, [ci].triggers, [ci].jobs, [ci].artifacts, [ci].summary"
-    )
-    if cfg.ci_jobs:
-        typer.echo("  blocks: custom-jobs")
-    else:
-        typer.echo("  blocks: checkout, setup-python, install-deps, command-steps")
-    typer.echo("justfile")
-    typer.echo("  renderer: render_just")
-    typer.echo("  inputs: [commands]")
-    typer.echo("  blocks: recipes-from-commands")
+    with _EchoBuffer() as out:
+        out.echo("--- explain ---")
+        out.echo(".github/workflows/ci.yml")
+        out.echo("  renderer: render_ci")
+        out.echo(
+            "  inputs: [python].version, [commands], [ci].install, [ci].cache, "
+            "[ci].python_versions, [ci].triggers, [ci].jobs, [ci].artifacts, [ci].summary"
+        )
+        if cfg.ci_jobs:
+            out.echo("  blocks: custom-jobs")
+        else:
+            out.echo("  blocks: checkout, setup-python, install-deps, command-steps")
+        out.extend(
+            (
+                "justfile",
+                "  renderer: render_just",
+                "  inputs: [commands]",
+                "  blocks: recipes-from-commands",
+            )
+        )
+
+
+_PYPROJECT_STATUS_RESULTS: dict[PyprojectPythonStatus, tuple[bool, str, str | None]] = {
+    PyprojectPythonStatus.FILE_MISSING: (
+        True,
+        "note: pyproject.toml not found; version cross-check skipped",
+        None,
+    ),
+    PyprojectPythonStatus.PROJECT_MISSING: (
+        True,
+        "note: pyproject.toml has no [project] table; version cross-check skipped",
+        None,
+    ),
+    PyprojectPythonStatus.REQUIRES_PYTHON_MISSING: (
+        True,
+        "note: [project].requires-python not set; version cross-check skipped",
+        None,
+    ),
+    PyprojectPythonStatus.INVALID: (
+        True,
+        "note: invalid requires-python value; version cross-check skipped",
+        None,
+    ),
+}
+_PYPROJECT_STATUS_RESULTS_STRICT: dict[PyprojectPythonStatus, tuple[bool, str, str | None]] = {
+    **_PYPROJECT_STATUS_RESULTS,
+    PyprojectPythonStatus.INVALID: (
+        False,
+        "invalid requires-python value in pyproject.toml",
+        ERR_VERSION,
+    ),
+}
 
 
 def _check_versions(cfg_python: str, strict: bool) -> tuple[bool, str, str | None]:
@@ -687,28 +945,26 @@ def _check_versions(cfg_python: str, strict: bool) -> tuple[bool, str, str | Non
     """
     status, pyproject_version = read_pyproject_python()
 
-    if status == PyprojectPythonStatus.FILE_MISSING:
-        return True, "note: pyproject.toml not found; version cross-check skipped", None
-    if status == PyprojectPythonStatus.PROJECT_MISSING:
-        return (
-            True,
-            "note: pyproject.toml has no [project] table; version cross-check skipped",
-            None,
-        )
-    if status == PyprojectPythonStatus.REQUIRES_PYTHON_MISSING:
-        return True, "note: [project].requires-python not set; version cross-check skipped", None
-    if status == PyprojectPythonStatus.INVALID:
-        if strict:
-            return False, "invalid requires-python value in pyproject.toml", ERR_VERSION
-        return True, "note: invalid requires-python value; version cross-check skipped", None
+    status_results = _PYPROJECT_STATUS_RESULTS_STRICT if strict else _PYPROJECT_STATUS_RESULTS
+    status_result = status_results.get(status)
+    if status_result is not None:
+        return status_result
 
     if pyproject_version is None:
         return True, "note: [project].requires-python not set; version cross-check skipped", None
 
-    spec = pyproject_version.strip()
+    return _evaluate_spec(pyproject_version.strip(), cfg_python, strict)
+
+
+@lru_cache(maxsize=128)
+def _evaluate_spec(spec: str, cfg_python: str, strict: bool) -> tuple[bool, str, str | None]:
+    """Compare a requires-python spec against intent's python version (pure, memoized)."""
+    # Identical plain versions match without importing packaging (common after reconcile).
+    if spec == cfg_python.strip() and _PLAIN_VERSION_RE.fullmatch(spec):
+        return True, f"pyproject requires_python matches intent ({spec})", None
 
     # Simple spec: no operators => treat as equality
-    if not any(ch in spec for ch in "<>,="):
+    if _SPEC_OPERATOR_RE.search(spec) is None:
         spec_version = parse_pep440_version(spec)
         cfg_version = parse_pep440_version(cfg_python)
         if spec_version is None:
@@ -755,26 +1011,24 @@ def _check_versions(cfg_python: str, strict: bool) -> tuple[bool, str, str | Non
 
 
 def _render_intent_template(python_version: str) -> str:
-    lines = [
-        "[intent]",
-        "schema_version = 1",
-        "",
-        "[python]",
-        f'version = "{python_version}"',
-        "",
-        "[commands]",
-        'test = "pytest -q"',
-        'lint = "ruff check ."',
-        "",
-        "[ci]",
-        'install = "-e .[dev]"',
-        "",
-        "[policy]",
-        'pack = "default"',
-        "strict = false",
-        "",
-    ]
-    return "\n".join(lines)
+    return (
+        "[intent]\n"
+        "schema_version = 1\n"
+        "\n"
+        "[python]\n"
+        f'version = "{python_version}"\n'
+        "\n"
+        "[commands]\n"
+        'test = "pytest -q"\n'
+        'lint = "ruff check ."\n'
+        "\n"
+        "[ci]\n"
+        'install = "-e .[dev]"\n'
+        "\n"
+        "[policy]\n"
+        'pack = "default"\n'
+        "strict = false\n"
+    )
 
 
 def _python_env_tag(python_version: str) -> str:
@@ -785,55 +1039,58 @@ def _python_env_tag(python_version: str) -> str:
 
 
 def _render_tox_ini_template(python_version: str) -> str:
-    env_tag = _python_env_tag(python_version)
-    lines = [
-        GENERATED_MARKER,
-        "# DO NOT EDIT",
-        "",
-        "[tox]",
-        f"envlist = {env_tag}",
-        "",
-        "[testenv]",
-        "deps =",
-        "    -e .[dev]",
-        "commands =",
-        "    pytest -q",
-        "",
-    ]
-    return "\n".join(lines)
+    return (
+        f"{GENERATED_MARKER}\n"
+        "# DO NOT EDIT\n"
+        "\n"
+        "[tox]\n"
+        f"envlist = {_python_env_tag(python_version)}\n"
+        "\n"
+        "[testenv]\n"
+        "deps =\n"
+        "    -e .[dev]\n"
+        "commands =\n"
+        "    pytest -q\n"
+    )
 
 
 def _render_noxfile_template() -> str:
-    lines = [
-        GENERATED_MARKER,
-        "# DO NOT EDIT",
-        "",
-        "import nox",
-        "",
-        "",
-        "@nox.session",
-        "def tests(session):",
-        '    session.install("-e", ".[dev]")',
-        '    session.run("pytest", "-q")',
-        "",
-    ]
-    return "\n".join(lines)
+    return (
+        f"{GENERATED_MARKER}\n"
+        "# DO NOT EDIT\n"
+        "\n"
+        "import nox\n"
+        "\n"
+        "\n"
+        "@nox.session\n"
+        "def tests(session):\n"
+        '    session.install("-e", ".[dev]")\n'
+        '    session.run("pytest", "-q")\n'
+    )
 
 
-def _infer_init_python_version(from_existing: bool) -> tuple[str, str]:
+def _infer_init_python_version(
+    from_existing: bool,
+    pyproject: tuple[PyprojectPythonStatus, str | None] | None = None,
+) -> tuple[str, str]:
     default_version = "3.12"
     if not from_existing:
         return default_version, "default"
 
-    status, raw = read_pyproject_python()
-    if status != PyprojectPythonStatus.OK or raw is None:
+    status, raw = pyproject if pyproject is not None else read_pyproject_python()
+    if status is not PyprojectPythonStatus.OK or raw is None:
         return default_version, "default"
 
     spec = raw.strip()
     if not spec:
         return default_version, "default"
 
-    if not any(ch in spec for ch in "<>,="):
+    if _SPEC_OPERATOR_RE.search(spec) is None:
+        # Plain dotted versions need no PEP 440 parse (and no packaging import).
+        if _PLAIN_VERSION_RE.fullmatch(spec):
+            numbers = parse_version(spec)
+            if numbers is not None and len(numbers) >= 2:
+                return f"{numbers[0]}.{numbers[1]}", "pyproject"
         parsed = parse_pep440_version(spec)
         if parsed is None:
             return default_version, "default"
@@ -851,28 +1108,26 @@ def _infer_init_python_version(from_existing: bool) -> tuple[str, str]:
     return default_version, "default"
 
 
-def _read_python_version_file(path: Path = Path(".python-version")) -> str | None:
-    if not path.exists():
+def _read_python_version_file(path: Path = _PYTHON_VERSION_PATH) -> str | None:
+    try:
+        raw = read_file_bytes(path).decode("utf-8").strip()
+    except FileNotFoundError:
         return None
-    raw = path.read_text(encoding="utf-8").strip()
     if not raw:
         return None
     return raw.splitlines()[0].strip() or None
 
 
-def _read_tool_versions_python(path: Path = Path(".tool-versions")) -> str | None:
-    if not path.exists():
+def _read_tool_versions_python(path: Path = _TOOL_VERSIONS_PATH) -> str | None:
+    try:
+        text = read_file_bytes(path).decode("utf-8")
+    except FileNotFoundError:
         return None
-    for line in path.read_text(encoding="utf-8").splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        parts = stripped.split()
-        if len(parts) >= 2 and parts[0] == "python":
-            return parts[1].strip() or None
-    return None
+    match = _TOOL_VERSIONS_PYTHON_RE.search(text)
+    return match.group(0).split()[1] if match is not None else None
 
 
+@lru_cache(maxsize=128)
 def _same_major_minor(lhs: str, rhs: str) -> bool:
     left = parse_version(lhs)
     right = parse_version(rhs)
@@ -889,98 +1144,221 @@ def _next_minor(version: str) -> str | None:
     return f"{major}.{minor + 1}"
 
 
-def _upsert_pyproject_requires_python(path: Path, new_spec: str) -> tuple[bool, str]:
-    if not path.exists():
-        content = (
-            f'[project]\nname = "REPLACE_ME"\nversion = "0.0.0"\nrequires-python = "{new_spec}"\n'
-        )
-        path.write_text(content, encoding="utf-8")
-        return True, "created"
-
-    text = path.read_text(encoding="utf-8")
-    lines = text.splitlines()
-    section_re = re.compile(r"^\s*\[([^\[\]]+)\]\s*$")
+def _toml_section_name(stripped: str) -> str | None:
+    """Return the table name for a stripped `[name]` header line (not `[[array]]`)."""
+    if not (stripped.startswith("[") and stripped.endswith("]")):
+        return None
+    name = stripped[1:-1]
+    if not name.strip() or "[" in name or "]" in name:
+        return None
+    return name.strip()
 
-    project_start: int | None = None
-    project_end = len(lines)
-    for idx, line in enumerate(lines):
-        match = section_re.match(line)
-        if not match:
-            continue
-        section = match.group(1).strip()
-        if section == "project":
-            project_start = idx
-            continue
-        if project_start is not None:
-            project_end = idx
-            break
 
-    changed = False
+def _upsert_pyproject_requires_python(path: Path, new_spec: str) -> tuple[bool, str]:
     new_line = f'requires-python = "{new_spec}"'
+    try:
+        text = read_file_bytes(path).decode("utf-8")
+    except FileNotFoundError:
+        content = f'[project]\nname = "REPLACE_ME"\nversion = "0.0.0"\n{new_line}\n'
+        atomic_write_text(path, content)
+        return True, "created"
 
-    if project_start is None:
-        if lines and lines[-1].strip():
-            lines.append("")
-        lines.extend(["[project]", new_line])
-        changed = True
-    else:
-        requires_idx: int | None = None
-        for idx in range(project_start + 1, project_end):
-            stripped = lines[idx].strip()
-            if stripped.startswith("requires-python") and "=" in stripped:
-                requires_idx = idx
+    # Single pass: locate [project] and its requires-python line as text offsets, so
+    # the edit is spliced into the original text and every other byte is kept as-is.
+    offset = 0
+    header_end: int | None = None
+    last_stripped = ""
+    for line in text.splitlines(keepends=True):
+        stripped = last_stripped = line.strip()
+        section = _toml_section_name(stripped)
+        if section is not None:
+            if header_end is not None:
                 break
-        if requires_idx is None:
-            lines.insert(project_start + 1, new_line)
-            changed = True
-        elif lines[requires_idx].strip() != new_line:
-            lines[requires_idx] = new_line
-            changed = True
+            if section == "project":
+                header_end = offset + len(line)
+                if not line.endswith(("\n", "\r")):
+                    text += "\n"
+                    header_end += 1
+        elif header_end is not None and stripped.startswith("requires-python") and "=" in stripped:
+            if stripped == new_line:
+                return False, "unchanged"
+            end = offset + len(line.rstrip("\r\n"))
+            atomic_write_text(path, text[:offset] + new_line + text[end:])
+            return True, "updated"
+        offset += len(line)
 
-    if changed:
-        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-        return True, "updated" if path.exists() else "created"
-    return False, "unchanged"
+    if header_end is not None:
+        new_text = text[:header_end] + new_line + "\n" + text[header_end:]
+    else:
+        if text and not text.endswith(("\n", "\r")):
+            text += "\n"
+        if last_stripped:
+            text += "\n"
+        new_text = f"{text}[project]\n{new_line}\n"
+    atomic_write_text(path, new_text)
+    return True, "updated"
 
 
 def _write_python_version(path: Path, version: str) -> tuple[bool, str]:
     new_text = f"{version}\n"
-    if not path.exists():
-        path.write_text(new_text, encoding="utf-8")
+    existing = _read_if_exists(path)
+    if existing is None:
+        atomic_write_text(path, new_text)
         return True, "created"
-    existing = path.read_text(encoding="utf-8")
-    if existing == new_text:
+    if existing == new_text.encode("utf-8"):
         return False, "unchanged"
-    path.write_text(new_text, encoding="utf-8")
+    atomic_write_text(path, new_text)
     return True, "updated"
 
 
 def _upsert_tool_versions_python(path: Path, version: str) -> tuple[bool, str]:
     new_line = f"python {version}"
-    if not path.exists():
-        path.write_text(new_line + "\n", encoding="utf-8")
+    try:
+        text = read_file_bytes(path).decode("utf-8")
+    except FileNotFoundError:
+        atomic_write_text(path, new_line + "\n")
         return True, "created"
 
-    lines = path.read_text(encoding="utf-8").splitlines()
-    for idx, line in enumerate(lines):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        parts = stripped.split()
-        if len(parts) >= 2 and parts[0] == "python":
-            if stripped == new_line:
-                return False, "unchanged"
-            lines[idx] = new_line
-            path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-            return True, "updated"
-
-    if lines and lines[-1].strip():
-        lines.append("")
-    lines.append(new_line)
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    match = _TOOL_VERSIONS_PYTHON_RE.search(text)
+    if match is not None:
+        if match.group(0).strip() == new_line:
+            return False, "unchanged"
+        atomic_write_text(path, text[: match.start()] + new_line + text[match.end() :])
+        return True, "updated"
+
+    if text and not text.endswith(("\n", "\r")):
+        text += "\n"
+    last_line = text.removesuffix("\n").rpartition("\n")[2]
+    if last_line.strip():
+        text += "\n"
+    atomic_write_text(path, f"{text}{new_line}\n")
     return True, "updated"
 
 
+@dataclass(frozen=True)
+class _ReconcileStep:
+    """
+    How one project file relates to the target Python version.
+
+    Exactly one outcome applies: aligned is set; write is None (manual fix only);
+    or write performs the change. skip_reason is None when --apply may write
+    without --allow-existing (the file or entry does not exist yet).
+    """
+
+    path: Path
+    aligned: str | None = None
+    status: str = ""
+    action: str = ""
+    skip_reason: str | None = None
+    write: Callable[[], str] | None = None
+    applied: str = ""
+
+
+def _pyproject_reconcile_step(target: str) -> _ReconcileStep:
+    path = _PYPROJECT_PATH
+    next_minor = _next_minor(target)
+    recommended = f">={target},<{next_minor}" if next_minor else f">={target}"
+
+    def write() -> str:
+        return _upsert_pyproject_requires_python(path, recommended)[1]
+
+    status, spec = read_pyproject_python(path)
+    if status is PyprojectPythonStatus.INVALID:
+        return _ReconcileStep(path, status="invalid/unreadable")
+    if status is PyprojectPythonStatus.OK:
+        assert spec is not None
+        lower = max_lower_bound(spec)
+        exact_lower_match = lower is not None and _same_major_minor(str(lower), target)
+        if check_requires_python_range(target, spec) is True and exact_lower_match:
+            return _ReconcileStep(path, aligned=f"requires-python={spec}")
+        return _ReconcileStep(
+            path,
+            status=f"drift (requires-python={spec})",
+            action=f"set requires-python = {recommended}",
+            skip_reason=f"drift={spec}",
+            write=write,
+            applied=f"requires-python={recommended}",
+        )
+
+    applied = f"[project].requires-python={recommended}"
+    if status is PyprojectPythonStatus.FILE_MISSING:
+        return _ReconcileStep(
+            path,
+            status="missing",
+            action=f"create/update [project].requires-python = {recommended}",
+            write=write,
+            applied=applied,
+        )
+    if status is PyprojectPythonStatus.PROJECT_MISSING:
+        return _ReconcileStep(
+            path,
+            status="[project] missing",
+            action=f"add [project].requires-python = {recommended}",
+            skip_reason="[project] missing",
+            write=write,
+            applied=applied,
+        )
+    return _ReconcileStep(
+        path,
+        status="requires-python missing",
+        action=f"add requires-python = {recommended}",
+        skip_reason="requires-python missing",
+        write=write,
+        applied=applied,
+    )
+
+
+def _python_version_reconcile_step(target: str) -> _ReconcileStep:
+    path = _PYTHON_VERSION_PATH
+    current = _read_python_version_file(path)
+    if current is not None and _same_major_minor(current, target):
+        return _ReconcileStep(path, aligned=current)
+
+    def write() -> str:
+        return _write_python_version(path, target)[1]
+
+    if current is None:
+        return _ReconcileStep(
+            path, status="missing", action=f"write {target}", write=write, applied=target
+        )
+    return _ReconcileStep(
+        path,
+        status=f"drift ({current})",
+        action=f"replace with {target}",
+        skip_reason=f"drift={current}",
+        write=write,
+        applied=target,
+    )
+
+
+def _tool_versions_reconcile_step(target: str) -> _ReconcileStep:
+    path = _TOOL_VERSIONS_PATH
+    current = _read_tool_versions_python(path)
+    if current is not None and _same_major_minor(current, target):
+        return _ReconcileStep(path, aligned=f"python {current}")
+
+    def write() -> str:
+        return _upsert_tool_versions_python(path, target)[1]
+
+    if current is None:
+        return _ReconcileStep(
+            path,
+            status="missing or no python entry",
+            action=f"add `python {target}`",
+            skip_reason="no python entry" if path.exists() else None,
+            write=write,
+            applied=f"python {target}",
+        )
+    return _ReconcileStep(
+        path,
+        status=f"drift (python {current})",
+        action=f"set `python {target}`",
+        skip_reason=f"drift={current}",
+        write=write,
+        applied=f"python {target}",
+    )
+
+
 @app.command()
 def init(
     intent_path: str = "intent.toml",
@@ -998,21 +1376,23 @@ def init(
     --from-existing: infer python version from pyproject.toml when possible.
     --force:         overwrite an existing intent.toml.
     """
+    from .config import IntentConfigError, load_intent
+
     starters = list(dict.fromkeys(starter))
     allowed_starters = {"tox", "nox"}
     invalid_starters = [item for item in starters if item not in allowed_starters]
     if invalid_starters:
         invalid = ", ".join(invalid_starters)
         typer.echo(
-            f"[{ERR_USAGE_CONFLICT}] Error: invalid --starter value(s): {invalid} "
-            "(expected: tox, nox)",
+            _USAGE_CONFLICT_PREFIX + f"invalid --starter value(s): {invalid} (expected: tox, nox)",
             err=True,
         )
         raise typer.Exit(code=2)
 
     path = Path(intent_path)
     wrote_intent = False
-    python_version, source = _infer_init_python_version(from_existing)
+    pyproject = read_pyproject_python() if from_existing else None
+    python_version, source = _infer_init_python_version(from_existing, pyproject)
     if path.exists() and not force:
         if not starters:
             typer.echo(
@@ -1025,15 +1405,14 @@ def init(
             python_version = existing_cfg.python_version
             typer.echo(f"Using existing {path}")
         except FileNotFoundError as e:
-            typer.echo(f"[{ERR_CONFIG_NOT_FOUND}] Error: {e}", err=True)
+            typer.echo(_CONFIG_NOT_FOUND_PREFIX + str(e), err=True)
             raise typer.Exit(code=2)
         except IntentConfigError as e:
-            typer.echo(f"[{ERR_CONFIG_INVALID}] Config error: {e}", err=True)
+            typer.echo(_CONFIG_INVALID_PREFIX + str(e), err=True)
             raise typer.Exit(code=2)
     else:
         content = _render_intent_template(python_version)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+        atomic_write_text(path, content)
         wrote_intent = True
         typer.echo(f"Wrote {path}")
 
@@ -1058,94 +1437,71 @@ def init(
 @app.command()
 def show(
     intent_path: str = "intent.toml",
-    output_format: Literal["text", "json"] = typer.Option("text", "--format"),
+    output_format: Annotated[OutputFormat, typer.Option("--format")] = OutputFormat.TEXT,
 ) -> None:
     """
     Show resolved Intent config and related inspection info.
     """
+    from .config import IntentConfigError, load_intent
+
     path = Path(intent_path)
     try:
         cfg = load_intent(path)
     except FileNotFoundError as e:
-        if output_format == "json":
-            typer.echo(
-                json.dumps(
-                    {
-                        "ok": False,
-                        "error": {"kind": "config", "message": f"{e}"},
-                        "code": ERR_CONFIG_NOT_FOUND,
-                    }
-                )
-            )
-            raise typer.Exit(code=2)
-        typer.echo(f"[{ERR_CONFIG_NOT_FOUND}] Error: {e}", err=True)
-        raise typer.Exit(code=2)
+        _emit_config_error(e, ERR_CONFIG_NOT_FOUND, output_format)
     except IntentConfigError as e:
-        if output_format == "json":
-            typer.echo(
-                json.dumps(
-                    {
-                        "ok": False,
-                        "error": {"kind": "config", "message": f"{e}"},
-                        "code": ERR_CONFIG_INVALID,
-                    }
-                )
-            )
-            raise typer.Exit(code=2)
-        typer.echo(f"[{ERR_CONFIG_INVALID}] Config error: {e}", err=True)
-        raise typer.Exit(code=2)
+        _emit_config_error(e, ERR_CONFIG_INVALID, output_format)
 
     resolved = _resolved_payload(path, cfg)
     pyproject_status = PyprojectPythonStatus(resolved["pyproject"]["status"])
     pyproject_requires_python = resolved["pyproject"]["requires_python"]
 
-    if output_format == "json":
-        typer.echo(json.dumps(resolved))
+    if output_format is OutputFormat.JSON:
+        _echo_json(resolved)
         raise typer.Exit(code=0)
 
-    typer.echo(f"Intent path: {path}")
-    typer.echo(f"Schema version: {cfg.schema_version}")
-    typer.echo(f"Python version: {cfg.python_version}")
-    typer.echo(f"Policy pack: {cfg.policy_pack or 'none'}")
-    typer.echo(f"Policy strict: {cfg.policy_strict}")
-    typer.echo(f"CI install: {cfg.ci_install}")
-    typer.echo("Commands:")
-    for name, cmd in cfg.commands.items():
-        typer.echo(f"  {name} -> {cmd}")
-    if cfg.ci_jobs:
-        typer.echo("CI jobs:")
-        for job in cfg.ci_jobs:
-            typer.echo(f"  {job.name} ({len(job.steps or [])} steps)")
-    if cfg.ci_artifacts:
-        typer.echo("CI artifacts:")
-        for artifact in cfg.ci_artifacts:
-            typer.echo(f"  {artifact.name}: {artifact.path} ({artifact.when})")
-    if cfg.ci_summary:
-        typer.echo(
-            f"CI summary: enabled={cfg.ci_summary.enabled} "
-            f"metrics={len(cfg.ci_summary.metrics or [])}"
-        )
-    if cfg.checks_assertions:
-        typer.echo("Checks:")
-        for assertion in cfg.checks_assertions:
-            typer.echo(
-                "  "
-                f"{assertion.command}: {assertion.path} {assertion.op} "
-                f"{assertion.value!r}"
+    with _EchoBuffer() as out:
+        out.echo(f"Intent path: {path}")
+        out.echo(f"Schema version: {cfg.schema_version}")
+        out.echo(f"Python version: {cfg.python_version}")
+        out.echo(f"Policy pack: {cfg.policy_pack or 'none'}")
+        out.echo(f"Policy strict: {cfg.policy_strict}")
+        out.echo(f"CI install: {cfg.ci_install}")
+        out.echo("Commands:")
+        out.extend(f"  {name} -> {cmd}" for name, cmd in cfg.commands.items())
+        if cfg.ci_jobs:
+            out.echo("CI jobs:")
+            out.extend(f"  {job.name} ({len(job.steps or [])} steps)" for job in cfg.ci_jobs)
+        if cfg.ci_artifacts:
+            out.echo("CI artifacts:")
+            out.extend(
+                f"  {artifact.name}: {artifact.path} ({artifact.when})"
+                for artifact in cfg.ci_artifacts
             )
-    if cfg.checks_gates:
-        typer.echo("Gates:")
-        for gate in cfg.checks_gates:
-            if gate.kind == "threshold":
-                typer.echo(
-                    f"  {gate.command}: {gate.path} "
-                    f"min={gate.min_value!r} max={gate.max_value!r}"
-                )
-            else:
-                typer.echo(f"  {gate.command}: {gate.path} equals {gate.equals_value!r}")
-    typer.echo(f"Pyproject status: {pyproject_status.value}")
-    if pyproject_requires_python is not None:
-        typer.echo(f"Pyproject requires-python: {pyproject_requires_python}")
+        if cfg.ci_summary:
+            out.echo(
+                f"CI summary: enabled={cfg.ci_summary.enabled} "
+                f"metrics={len(cfg.ci_summary.metrics or [])}"
+            )
+        if cfg.checks_assertions:
+            out.echo("Checks:")
+            out.extend(
+                f"  {assertion.command}: {assertion.path} {assertion.op} {assertion.value!r}"
+                for assertion in cfg.checks_assertions
+            )
+        if cfg.checks_gates:
+            out.echo("Gates:")
+            for gate in cfg.checks_gates:
+                if gate.kind == "threshold":
+                    out.echo(
+                        f"  {gate.command}: {gate.path} "
+                        f"min={gate.min_value!r} max={gate.max_value!r}"
+                    )
+                else:
+                    out.echo(f"  {gate.command}: {gate.path} equals {gate.equals_value!r}")
+        out.echo(f"Pyproject status: {pyproject_status.value}")
+        if pyproject_requires_python is not None:
+            out.echo(f"Pyproject requires-python: {pyproject_requires_python}")
 
 
 @app.command()
@@ -1166,22 +1522,23 @@ def sync(
     --dry-run: show what would be written/updated (no writes)
     --write:   write tool-owned generated files
     """
+    from .config import IntentConfigError, load_intent
+
+    ok_mark, fail_mark = _status_marks()
     if write and dry_run:
         typer.echo(
-            f"[{ERR_USAGE_CONFLICT}] Error: --write and --dry-run cannot be used together", err=True
+            _USAGE_CONFLICT_PREFIX + "--write and --dry-run cannot be used together", err=True
         )
         raise typer.Exit(code=2)
     if adopt and force:
-        typer.echo(
-            f"[{ERR_USAGE_CONFLICT}] Error: --adopt and --force cannot be used together", err=True
-        )
+        typer.echo(_USAGE_CONFLICT_PREFIX + "--adopt and --force cannot be used together", err=True)
         raise typer.Exit(code=2)
     if (adopt or force) and not write:
-        typer.echo(f"[{ERR_USAGE_CONFLICT}] Error: --adopt/--force require --write", err=True)
+        typer.echo(_USAGE_CONFLICT_PREFIX + "--adopt/--force require --write", err=True)
         raise typer.Exit(code=2)
     if (show_json or explain) and write:
         typer.echo(
-            f"[{ERR_USAGE_CONFLICT}] Error: --show-json/--explain cannot be used with --write",
+            _USAGE_CONFLICT_PREFIX + "--show-json/--explain cannot be used with --write",
             err=True,
         )
         raise typer.Exit(code=2)
@@ -1191,134 +1548,148 @@ def sync(
     try:
         cfg = load_intent(path)
     except FileNotFoundError as e:
-        typer.echo(f"[{ERR_CONFIG_NOT_FOUND}] Error: {e}", err=True)
+        typer.echo(_CONFIG_NOT_FOUND_PREFIX + str(e), err=True)
         typer.echo("Fix: run `intent init` to create a starter config.", err=True)
         raise typer.Exit(code=2)
     except IntentConfigError as e:
-        typer.echo(f"[{ERR_CONFIG_INVALID}] Config error: {e}", err=True)
+        typer.echo(_CONFIG_INVALID_PREFIX + str(e), err=True)
         raise typer.Exit(code=2)
 
-    ci_path = Path(".github/workflows/ci.yml")
-    just_path = Path("justfile")
-    ci_content = render_ci(cfg)
-    just_content = render_just(cfg)
-
     if show_json:
         payload = _resolved_payload(path, cfg)
         payload["sync"] = {
             "show_json": True,
             "explain": explain,
             "generated": {
-                "ci": str(ci_path),
-                "justfile": str(just_path),
+                "ci": str(_CI_PATH),
+                "justfile": str(_JUST_PATH),
             },
             "explain_map": _sync_explain_payload(cfg) if explain else None,
         }
-        typer.echo(json.dumps(payload))
+        _echo_json(payload)
         raise typer.Exit(code=0)
 
     if explain:
         _print_sync_explain_text(cfg)
         raise typer.Exit(code=0)
 
-    if not write and not dry_run:
-        typer.echo(f"Intent python version: {cfg.python_version}")
-        typer.echo("Intent commands: " + ", ".join(cfg.commands.keys()))
-
-    ok_versions, msg_versions, _ = _check_versions(cfg.python_version, strict=False)
-    typer.echo(msg_versions)
-
-    if show_ci:
-        typer.echo("\n--- ci.yml (preview) ---\n")
-        typer.echo(ci_content)
-
-    if show_just:
-        typer.echo("\n--- justfile (preview) ---\n")
-        typer.echo(just_content)
-
-    if dry_run:
-        typer.echo("\n--- dry-run ---")
-        typer.echo(_preview_status(ci_path, ci_content))
-        typer.echo(_preview_status(just_path, just_content))
-        raise typer.Exit(code=0)
-
-    if write:
-        mode = "strict"
-        if adopt:
-            mode = "adopt"
-        elif force:
-            mode = "force"
-        try:
-            ci_changed = write_generated_file(ci_path, ci_content, mode=mode)
-            just_changed = write_generated_file(just_path, just_content, mode=mode)
-        except OwnershipError as e:
-            typer.echo(f"[{ERR_OWNERSHIP}] {e}", err=True)
-            raise typer.Exit(code=1)
-
-        typer.echo(f"Wrote {ci_path}" if ci_changed else f"No changes to {ci_path}")
-        typer.echo(f"Wrote {just_path}" if just_changed else f"No changes to {just_path}")
-
-        hook_results = _run_plugin_hooks(cfg.plugin_generate_hooks, stage="generate")
-        for result in hook_results:
-            if result["ok"]:
-                typer.echo(f"✓ plugin generate: {result['command']}")
-                continue
-            typer.echo(
-                f"✗ [{ERR_PLUGIN}] plugin generate failed ({result['exit_code']}): "
-                f"{result['command']}",
-                err=True,
+    # Render only what a preview or write will actually use.
+    ci_content = just_content = ""
+    if show_ci or dry_run or write:
+        from .render_ci import render_ci
+
+        ci_content = render_ci(cfg)
+    if show_just or dry_run or write:
+        from .render_just import render_just
+
+        just_content = render_just(cfg)
+
+    with _EchoBuffer() as out:
+        if not write and not dry_run:
+            out.echo(f"Intent python version: {cfg.python_version}")
+            out.echo("Intent commands: " + ", ".join(cfg.commands.keys()))
+
+        ok_versions, msg_versions, _ = _check_versions(cfg.python_version, strict=False)
+        out.echo(msg_versions)
+
+        if show_ci:
+            out.echo("\n--- ci.yml (preview) ---\n")
+            out.echo(ci_content)
+
+        if show_just:
+            out.echo("\n--- justfile (preview) ---\n")
+            out.echo(just_content)
+
+        if dry_run:
+            out.echo("\n--- dry-run ---")
+            out.echo(_preview_status(_CI_PATH, ci_content, _read_if_exists(_CI_PATH)))
+            out.echo(_preview_status(_JUST_PATH, just_content, _read_if_exists(_JUST_PATH)))
+            raise typer.Exit(code=0)
+
+        if write:
+            mode = "strict"
+            if adopt:
+                mode = "adopt"
+            elif force:
+                mode = "force"
+            try:
+                ci_changed = _write_generated_if_changed(_CI_PATH, ci_content, mode)
+                just_changed = _write_generated_if_changed(_JUST_PATH, just_content, mode)
+            except OwnershipError as e:
+                out.echo(f"[{ERR_OWNERSHIP}] {e}", err=True)
+                raise typer.Exit(code=1)
+
+            out.echo(f"Wrote {_CI_PATH}" if ci_changed else f"No changes to {_CI_PATH}")
+            out.echo(f"Wrote {_JUST_PATH}" if just_changed else f"No changes to {_JUST_PATH}")
+
+            out.flush()
+            hook_results = _run_plugin_hooks(
+                cfg.plugin_generate_hooks, stage="generate", parallel=cfg.plugins_parallel
             )
-            if result["stderr"]:
-                typer.echo(f"  stderr: {result['stderr']}", err=True)
-            raise typer.Exit(code=1)
+            for result in hook_results:
+                if result["ok"]:
+                    out.echo(f"{ok_mark} plugin generate: {result['command']}")
+                    continue
+                out.echo(
+                    f"{fail_mark} [{ERR_PLUGIN}] plugin generate failed ({result['exit_code']}): "
+                    f"{result['command']}",
+                    err=True,
+                )
+                if result["stderr"]:
+                    out.echo(f"  stderr: {result['stderr']}", err=True)
+                raise typer.Exit(code=1)
+
+
+def _echo_check_core_status(
+    out: _EchoBuffer,
+    marks: tuple[str, str],
+    statuses: list[tuple[bool, str, str | None]],
+) -> bool:
+    """Echo version and generated-file results for check; return True on drift."""
+    ok_mark, fail_mark = marks
+    drift = False
+    for ok, message, code in statuses:
+        if not ok:
+            drift = True
+            out.echo(f"{fail_mark} [{code}] {message}", err=True)
+        elif message.startswith("note:"):
+            out.echo(message)
+        else:
+            out.echo(f"{ok_mark} {message}")
+    return drift
 
 
 @app.command()
 def check(
     intent_path: str = "intent.toml",
     strict: bool | None = typer.Option(None, "--strict/--no-strict"),
-    output_format: Literal["text", "json"] = typer.Option("text", "--format"),
+    output_format: Annotated[OutputFormat, typer.Option("--format")] = OutputFormat.TEXT,
+    fail_fast: bool = typer.Option(False, "--fail-fast"),
 ) -> None:
     """
     Check drift without writing.
 
+    --fail-fast: stop before plugin hooks and [checks] commands once version or
+                 generated-file drift is found (text output only).
+
     Exit codes:
       0 = OK
       1 = drift / mismatch found
       2 = config/usage error
     """
+    from .config import IntentConfigError, load_intent
+    from .render_ci import render_ci
+    from .render_just import render_just
+
     path = Path(intent_path)
+    ok_mark, fail_mark = _status_marks()
 
     try:
         cfg = load_intent(path)
     except FileNotFoundError as e:
-        if output_format == "json":
-            typer.echo(
-                json.dumps(
-                    {
-                        "ok": False,
-                        "error": {"kind": "config", "message": f"{e}"},
-                        "code": ERR_CONFIG_NOT_FOUND,
-                    }
-                )
-            )
-            raise typer.Exit(code=2)
-        typer.echo(f"[{ERR_CONFIG_NOT_FOUND}] Error: {e}", err=True)
-        raise typer.Exit(code=2)
+        _emit_config_error(e, ERR_CONFIG_NOT_FOUND, output_format)
     except IntentConfigError as e:
-        if output_format == "json":
-            typer.echo(
-                json.dumps(
-                    {
-                        "ok": False,
-                        "error": {"kind": "config", "message": f"{e}"},
-                        "code": ERR_CONFIG_INVALID,
-                    }
-                )
-            )
-            raise typer.Exit(code=2)
-        typer.echo(f"[{ERR_CONFIG_INVALID}] Config error: {e}", err=True)
-        raise typer.Exit(code=2)
+        _emit_config_error(e, ERR_CONFIG_INVALID, output_format)
 
     drift = False
     effective_strict = cfg.policy_strict if strict is None else strict
@@ -1327,20 +1698,40 @@ def check(
         cfg.python_version,
         strict=effective_strict,
     )
-    ci_path = Path(".github/workflows/ci.yml")
-    just_path = Path("justfile")
+    ci_content = render_ci(cfg)
+    just_content = render_just(cfg)
+
+    ci_ok, ci_msg, ci_code = _generated_drift_status(
+        _CI_PATH, ci_content, _read_if_exists(_CI_PATH)
+    )
+    just_ok, just_msg, just_code = _generated_drift_status(
+        _JUST_PATH, just_content, _read_if_exists(_JUST_PATH)
+    )
+    core_statuses = [
+        (ok_versions, msg_versions, versions_code),
+        (ci_ok, ci_msg, ci_code),
+        (just_ok, just_msg, just_code),
+    ]
+    if fail_fast and output_format is OutputFormat.TEXT and not (ok_versions and ci_ok and just_ok):
+        # Drift is already proven; skip plugin hooks and check commands.
+        with _EchoBuffer() as out:
+            _echo_check_core_status(out, (ok_mark, fail_mark), core_statuses)
+            out.echo(_SYNC_WRITE_HINT, err=True)
+        raise typer.Exit(code=1)
 
-    ci_ok, ci_msg, ci_code = _generated_drift_status(ci_path, render_ci(cfg))
-    just_ok, just_msg, just_code = _generated_drift_status(just_path, render_just(cfg))
-    plugin_results = _run_plugin_hooks(cfg.plugin_check_hooks, stage="check")
+    plugin_results = _run_plugin_hooks(
+        cfg.plugin_check_hooks, stage="check", parallel=cfg.plugins_parallel
+    )
     all_assertions = [
         *(cfg.checks_assertions or []),
         *_expand_gates_to_assertions(cfg.checks_gates),
     ]
-    commands_for_json: set[str] = {item.command for item in all_assertions}
+    commands_for_json = dict.fromkeys(item.command for item in all_assertions)
     if cfg.ci_summary and cfg.ci_summary.metrics:
-        commands_for_json.update(metric.command for metric in cfg.ci_summary.metrics)
-    command_results = _run_json_commands(cfg.commands, commands_for_json)
+        commands_for_json.update(dict.fromkeys(metric.command for metric in cfg.ci_summary.metrics))
+    command_results = _run_json_commands(
+        cfg.commands, commands_for_json, parallel=cfg.checks_parallel
+    )
     assertion_results = _run_check_assertions(all_assertions, command_results)
     baseline_payload, baseline_unavailable_reason, baseline_source, baseline_on_missing = (
         _load_summary_baseline(cfg)
@@ -1353,16 +1744,17 @@ def check(
         baseline_unavailable_reason=baseline_unavailable_reason,
         baseline_on_missing=baseline_on_missing,
     )
-    summary_markdown = None
-    if cfg.ci_summary and cfg.ci_summary.enabled:
-        summary_markdown = _render_summary_markdown(
-            title=cfg.ci_summary.title,
-            include_assertions=cfg.ci_summary.include_assertions,
-            assertions=assertion_results,
-            metrics=summary_metrics,
-        )
 
-    if output_format == "json":
+    if output_format is OutputFormat.JSON:
+        # Only the JSON report carries the markdown summary; text mode never renders it.
+        summary_markdown = None
+        if cfg.ci_summary and cfg.ci_summary.enabled:
+            summary_markdown = _render_summary_markdown(
+                title=cfg.ci_summary.title,
+                include_assertions=cfg.ci_summary.include_assertions,
+                assertions=assertion_results,
+                metrics=summary_metrics,
+            )
         if not ok_versions:
             drift = True
         if not ci_ok:
@@ -1387,13 +1779,13 @@ def check(
             },
             "files": [
                 {
-                    "path": str(ci_path),
+                    "path": str(_CI_PATH),
                     "ok": ci_ok,
                     "message": ci_msg,
                     "code": ci_code,
                 },
                 {
-                    "path": str(just_path),
+                    "path": str(_JUST_PATH),
                     "ok": just_ok,
                     "message": just_msg,
                     "code": just_code,
@@ -1407,110 +1799,94 @@ def check(
                 "metrics": summary_metrics,
             },
         }
-        typer.echo(json.dumps(payload))
+        _echo_json(payload)
         raise typer.Exit(code=1 if drift else 0)
 
-    if not ok_versions:
-        drift = True
-        typer.echo(f"✗ [{versions_code}] {msg_versions}", err=True)
-    else:
-        if msg_versions.startswith("note:"):
-            typer.echo(msg_versions)
-        else:
-            typer.echo(f"✓ {msg_versions}")
+    with _EchoBuffer() as out:
+        drift = _echo_check_core_status(out, (ok_mark, fail_mark), core_statuses)
 
-    if ci_ok:
-        typer.echo(f"✓ {ci_msg}")
-    else:
-        drift = True
-        typer.echo(f"✗ [{ci_code}] {ci_msg}", err=True)
+        for result in plugin_results:
+            if result["ok"]:
+                out.echo(f"{ok_mark} plugin check: {result['command']}")
+            else:
+                drift = True
+                out.echo(
+                    f"{fail_mark} [{ERR_PLUGIN}] plugin check failed ({result['exit_code']}): "
+                    f"{result['command']}",
+                    err=True,
+                )
+                if result["stderr"]:
+                    out.echo(f"  stderr: {result['stderr']}", err=True)
+
+        grouped_failures: dict[tuple[str, str], list[dict]] = {}
+        for result in assertion_results:
+            description = (
+                f"check assertion ({result['command']}): "
+                f"{result['path']} {result['op']} {result['expected']!r}"
+            )
+            if result["ok"]:
+                out.echo(f"{ok_mark} {description} (actual={result['actual']!r})")
+                continue
+            reason = result.get("reason") or "assertion failed"
+            if reason.startswith("command failed with exit code") or reason.startswith(
+                "stdout is not valid JSON"
+            ):
+                grouped_failures.setdefault((result["command"], reason), []).append(result)
+                continue
+            drift = True
+            out.echo(f"{fail_mark} [{ERR_CHECK}] {description}", err=True)
+            if result.get("message"):
+                out.echo(f"  note: {result['message']}", err=True)
+            if result.get("reason"):
+                out.echo(f"  reason: {result['reason']}", err=True)
+            if result.get("actual") is not None:
+                out.echo(f"  actual: {result['actual']!r}", err=True)
+
+        for (command, reason), results in grouped_failures.items():
+            drift = True
+            out.echo(
+                f"{fail_mark} [{ERR_CHECK}] check assertions ({command}) failed before evaluation",
+                err=True,
+            )
+            out.echo(f"  reason: {reason}", err=True)
+            out.echo(f"  affected assertions: {len(results)}", err=True)
 
-    if just_ok:
-        typer.echo(f"✓ {just_msg}")
-    else:
-        drift = True
-        typer.echo(f"✗ [{just_code}] {just_msg}", err=True)
+        grouped_metric_failures: dict[tuple[str, str], list[dict]] = {}
+        for metric in summary_metrics:
+            metric_desc = (
+                f"summary metric ({metric['command']}): {metric['label']} @ {metric['path']}"
+            )
+            if metric["ok"]:
+                if metric["delta"] is not None:
+                    out.echo(
+                        f"{ok_mark} {metric_desc} value={metric['value']!r} "
+                        f"baseline={metric['baseline']!r} delta={metric['delta']!r}"
+                    )
+                else:
+                    out.echo(f"{ok_mark} {metric_desc} value={metric['value']!r}")
+                continue
+            reason = metric.get("reason") or "metric evaluation failed"
+            if reason.startswith("command failed with exit code") or reason.startswith(
+                "stdout is not valid JSON"
+            ):
+                grouped_metric_failures.setdefault((metric["command"], reason), []).append(metric)
+                continue
+            drift = True
+            out.echo(f"{fail_mark} [{ERR_CHECK}] {metric_desc}", err=True)
+            out.echo(f"  reason: {reason}", err=True)
 
-    for result in plugin_results:
-        if result["ok"]:
-            typer.echo(f"✓ plugin check: {result['command']}")
-        else:
+        for (command, reason), metrics in grouped_metric_failures.items():
             drift = True
-            typer.echo(
-                f"✗ [{ERR_PLUGIN}] plugin check failed ({result['exit_code']}): "
-                f"{result['command']}",
+            out.echo(
+                f"{fail_mark} [{ERR_CHECK}] summary metrics ({command}) failed before evaluation",
                 err=True,
             )
-            if result["stderr"]:
-                typer.echo(f"  stderr: {result['stderr']}", err=True)
-
-    grouped_failures: dict[tuple[str, str], list[dict]] = {}
-    for result in assertion_results:
-        description = (
-            f"check assertion ({result['command']}): "
-            f"{result['path']} {result['op']} {result['expected']!r}"
-        )
-        if result["ok"]:
-            typer.echo(f"✓ {description} (actual={result['actual']!r})")
-            continue
-        reason = result.get("reason") or "assertion failed"
-        if reason.startswith("command failed with exit code") or reason.startswith(
-            "stdout is not valid JSON"
-        ):
-            grouped_failures.setdefault((result["command"], reason), []).append(result)
-            continue
-        drift = True
-        typer.echo(f"✗ [{ERR_CHECK}] {description}", err=True)
-        if result.get("message"):
-            typer.echo(f"  note: {result['message']}", err=True)
-        if result.get("reason"):
-            typer.echo(f"  reason: {result['reason']}", err=True)
-        if result.get("actual") is not None:
-            typer.echo(f"  actual: {result['actual']!r}", err=True)
-
-    for (command, reason), results in grouped_failures.items():
-        drift = True
-        typer.echo(
-            f"✗ [{ERR_CHECK}] check assertions ({command}) failed before evaluation",
-            err=True,
-        )
-        typer.echo(f"  reason: {reason}", err=True)
-        typer.echo(f"  affected assertions: {len(results)}", err=True)
-
-    grouped_metric_failures: dict[tuple[str, str], list[dict]] = {}
-    for metric in summary_metrics:
-        metric_desc = f"summary metric ({metric['command']}): {metric['label']} @ {metric['path']}"
-        if metric["ok"]:
-            if metric["delta"] is not None:
-                typer.echo(
-                    f"✓ {metric_desc} value={metric['value']!r} "
-                    f"baseline={metric['baseline']!r} delta={metric['delta']!r}"
-                )
-            else:
-                typer.echo(f"✓ {metric_desc} value={metric['value']!r}")
-            continue
-        reason = metric.get("reason") or "metric evaluation failed"
-        if reason.startswith("command failed with exit code") or reason.startswith(
-            "stdout is not valid JSON"
-        ):
-            grouped_metric_failures.setdefault((metric["command"], reason), []).append(metric)
-            continue
-        drift = True
-        typer.echo(f"✗ [{ERR_CHECK}] {metric_desc}", err=True)
-        typer.echo(f"  reason: {reason}", err=True)
+            out.echo(f"  reason: {reason}", err=True)
+            out.echo(f"  affected metrics: {len(metrics)}", err=True)
 
-    for (command, reason), metrics in grouped_metric_failures.items():
-        drift = True
-        typer.echo(
-            f"✗ [{ERR_CHECK}] summary metrics ({command}) failed before evaluation",
-            err=True,
-        )
-        typer.echo(f"  reason: {reason}", err=True)
-        typer.echo(f"  affected metrics: {len(metrics)}", err=True)
-
-    if drift:
-        typer.echo("\nHint: run `intent sync --write` to update generated files.", err=True)
-        raise typer.Exit(code=1)
+        if drift:
+            out.echo(_SYNC_WRITE_HINT, err=True)
+            raise typer.Exit(code=1)
 
     raise typer.Exit(code=0)
 
@@ -1528,59 +1904,68 @@ def doctor(
       1 = issues found
       2 = config/usage error
     """
+    from .config import IntentConfigError, load_intent
+    from .render_ci import render_ci
+    from .render_just import render_just
+
     path = Path(intent_path)
+    ok_mark, fail_mark = _status_marks()
     try:
         cfg = load_intent(path)
     except FileNotFoundError as e:
-        typer.echo(f"[{ERR_CONFIG_NOT_FOUND}] Error: {e}", err=True)
+        typer.echo(_CONFIG_NOT_FOUND_PREFIX + str(e), err=True)
         typer.echo("Fix: run `intent init` to create a starter config.", err=True)
         raise typer.Exit(code=2)
     except IntentConfigError as e:
-        typer.echo(f"[{ERR_CONFIG_INVALID}] Config error: {e}", err=True)
+        typer.echo(_CONFIG_INVALID_PREFIX + str(e), err=True)
         typer.echo("Fix: open intent.toml and correct the invalid field/type.", err=True)
         raise typer.Exit(code=2)
 
     issues = False
     effective_strict = cfg.policy_strict if strict is None else strict
 
-    typer.echo("--- doctor ---")
-    typer.echo(f"Intent path: {path}")
+    with _EchoBuffer() as out:
+        out.echo("--- doctor ---")
+        out.echo(f"Intent path: {path}")
 
-    ok_versions, msg_versions, versions_code = _check_versions(
-        cfg.python_version,
-        strict=effective_strict,
-    )
-    if ok_versions:
-        typer.echo(f"✓ versions: {msg_versions}")
-    else:
-        issues = True
-        typer.echo(f"✗ [{versions_code}] versions: {msg_versions}", err=True)
-        typer.echo("  Fix: align [python].version with pyproject requires-python.", err=True)
-
-    file_checks = [
-        (Path(".github/workflows/ci.yml"), render_ci(cfg)),
-        (Path("justfile"), render_just(cfg)),
-    ]
-    for file_path, content in file_checks:
-        ok, message, code = _generated_drift_status(file_path, content)
-        if ok:
-            typer.echo(f"✓ {message}")
-            continue
-        issues = True
-        typer.echo(f"✗ [{code}] {message}", err=True)
-        if code in (ERR_FILE_MISSING, ERR_FILE_OUTDATED):
-            typer.echo("  Fix: run `intent sync --write`.", err=True)
-        elif code == ERR_FILE_UNOWNED:
-            typer.echo(
-                "  Fix: keep it user-owned or replace it explicitly with generated output.",
-                err=True,
-            )
+        ok_versions, msg_versions, versions_code = _check_versions(
+            cfg.python_version,
+            strict=effective_strict,
+        )
+        if ok_versions:
+            out.echo(f"{ok_mark} versions: {msg_versions}")
+        else:
+            issues = True
+            out.echo(f"{fail_mark} [{versions_code}] versions: {msg_versions}", err=True)
+            out.echo("  Fix: align [python].version with pyproject requires-python.", err=True)
+
+        ci_content = render_ci(cfg)
+        just_content = render_just(cfg)
+        file_checks = [
+            (_CI_PATH, ci_content),
+            (_JUST_PATH, just_content),
+        ]
+        for file_path, content in file_checks:
+            existing = _read_if_exists(file_path)
+            ok, message, code = _generated_drift_status(file_path, content, existing)
+            if ok:
+                out.echo(f"{ok_mark} {message}")
+                continue
+            issues = True
+            out.echo(f"{fail_mark} [{code}] {message}", err=True)
+            if code in (ERR_FILE_MISSING, ERR_FILE_OUTDATED):
+                out.echo("  Fix: run `intent sync --write`.", err=True)
+            elif code == ERR_FILE_UNOWNED:
+                out.echo(
+                    "  Fix: keep it user-owned or replace it explicitly with generated output.",
+                    err=True,
+                )
 
-    if issues:
-        raise typer.Exit(code=1)
+        if issues:
+            raise typer.Exit(code=1)
 
-    typer.echo("No issues found.")
-    raise typer.Exit(code=0)
+        out.echo("No issues found.")
+        raise typer.Exit(code=0)
 
 
 @app.command()
@@ -1597,9 +1982,11 @@ def reconcile(
     """
     Plan Python-version reconciliation across supported project files.
     """
+    from .config import IntentConfigError, load_intent
+
     if plan == apply:
         typer.echo(
-            f"[{ERR_USAGE_CONFLICT}] Error: choose exactly one of --plan or --apply",
+            _USAGE_CONFLICT_PREFIX + "choose exactly one of --plan or --apply",
             err=True,
         )
         raise typer.Exit(code=2)
@@ -1608,158 +1995,57 @@ def reconcile(
     try:
         cfg = load_intent(path)
     except FileNotFoundError as e:
-        typer.echo(f"[{ERR_CONFIG_NOT_FOUND}] Error: {e}", err=True)
+        typer.echo(_CONFIG_NOT_FOUND_PREFIX + str(e), err=True)
         raise typer.Exit(code=2)
     except IntentConfigError as e:
-        typer.echo(f"[{ERR_CONFIG_INVALID}] Config error: {e}", err=True)
+        typer.echo(_CONFIG_INVALID_PREFIX + str(e), err=True)
         raise typer.Exit(code=2)
 
     target = cfg.python_version
-    next_minor = _next_minor(target)
-    recommended_pyproject = f">={target},<{next_minor}" if next_minor else f">={target}"
-    pyproject_path = Path("pyproject.toml")
-    pyproject_status, pyproject_spec = read_pyproject_python(pyproject_path)
-    python_version_current = _read_python_version_file()
-    tool_versions_current = _read_tool_versions_python()
-
-    mode = "apply" if apply else "plan"
-    typer.echo(f"--- reconcile {mode} ---")
-    typer.echo(f"Target python version (from intent): {target}")
-    typer.echo("")
-
-    unresolved = False
+    steps = [
+        _pyproject_reconcile_step(target),
+        _python_version_reconcile_step(target),
+        _tool_versions_reconcile_step(target),
+    ]
 
-    if pyproject_status == PyprojectPythonStatus.FILE_MISSING:
-        if apply:
-            _, action = _upsert_pyproject_requires_python(pyproject_path, recommended_pyproject)
-            typer.echo(
-                f"- {pyproject_path}: {action} ([project].requires-python={recommended_pyproject})"
-            )
-        else:
-            typer.echo(f"- {pyproject_path}: missing")
-            typer.echo(
-                f"  action: create/update [project].requires-python = {recommended_pyproject}"
-            )
-    elif pyproject_status == PyprojectPythonStatus.PROJECT_MISSING:
-        if apply and allow_existing:
-            _, action = _upsert_pyproject_requires_python(pyproject_path, recommended_pyproject)
-            typer.echo(
-                f"- {pyproject_path}: {action} ([project].requires-python={recommended_pyproject})"
-            )
-        elif apply:
-            unresolved = True
-            typer.echo(f"- {pyproject_path}: skipped ([project] missing, use --allow-existing)")
-        else:
-            typer.echo(f"- {pyproject_path}: [project] missing")
-            typer.echo(f"  action: add [project].requires-python = {recommended_pyproject}")
-    elif pyproject_status == PyprojectPythonStatus.REQUIRES_PYTHON_MISSING:
-        if apply and allow_existing:
-            _, action = _upsert_pyproject_requires_python(pyproject_path, recommended_pyproject)
-            typer.echo(
-                f"- {pyproject_path}: {action} ([project].requires-python={recommended_pyproject})"
-            )
-        elif apply:
-            unresolved = True
-            typer.echo(
-                f"- {pyproject_path}: skipped (requires-python missing, use --allow-existing)"
-            )
-        else:
-            typer.echo(f"- {pyproject_path}: requires-python missing")
-            typer.echo(f"  action: add requires-python = {recommended_pyproject}")
-    elif pyproject_status == PyprojectPythonStatus.INVALID:
-        typer.echo(f"- {pyproject_path}: invalid/unreadable")
-        if apply:
-            unresolved = True
-            typer.echo("  action: manual fix required before reconcile --apply")
-        else:
-            typer.echo("  action: manual fix required before auto-reconcile")
-    else:
-        assert pyproject_spec is not None
-        in_range = check_requires_python_range(target, pyproject_spec)
-        lower = max_lower_bound(pyproject_spec)
-        exact_lower_match = lower is not None and _same_major_minor(str(lower), target)
-        if in_range is True and exact_lower_match:
-            typer.echo(f"- {pyproject_path}: aligned (requires-python={pyproject_spec})")
-        else:
-            if apply and allow_existing:
-                _, action = _upsert_pyproject_requires_python(pyproject_path, recommended_pyproject)
-                typer.echo(
-                    f"- {pyproject_path}: {action} (requires-python={recommended_pyproject})"
-                )
+    with _EchoBuffer() as out:
+        mode = "apply" if apply else "plan"
+        out.echo(f"--- reconcile {mode} ---")
+        out.echo(f"Target python version (from intent): {target}")
+        out.echo("")
+
+        unresolved = False
+        for step in steps:
+            if step.aligned is not None:
+                out.echo(f"- {step.path}: aligned ({step.aligned})")
+            elif step.write is None:
+                out.echo(f"- {step.path}: {step.status}")
+                if apply:
+                    unresolved = True
+                    out.echo("  action: manual fix required before reconcile --apply")
+                else:
+                    out.echo("  action: manual fix required before auto-reconcile")
+            elif apply and (allow_existing or step.skip_reason is None):
+                out.echo(f"- {step.path}: {step.write()} ({step.applied})")
             elif apply:
                 unresolved = True
-                typer.echo(
-                    f"- {pyproject_path}: skipped (drift={pyproject_spec}, use --allow-existing)"
-                )
+                out.echo(f"- {step.path}: skipped ({step.skip_reason}, use --allow-existing)")
             else:
-                typer.echo(f"- {pyproject_path}: drift (requires-python={pyproject_spec})")
-                typer.echo(f"  action: set requires-python = {recommended_pyproject}")
+                out.echo(f"- {step.path}: {step.status}")
+                out.echo(f"  action: {step.action}")
 
-    python_version_path = Path(".python-version")
-    if python_version_current is None:
+        out.echo("")
         if apply:
-            _, action = _write_python_version(python_version_path, target)
-            typer.echo(f"- {python_version_path}: {action} ({target})")
-        else:
-            typer.echo(f"- {python_version_path}: missing")
-            typer.echo(f"  action: write {target}")
-    elif _same_major_minor(python_version_current, target):
-        typer.echo(f"- {python_version_path}: aligned ({python_version_current})")
-    else:
-        if apply and allow_existing:
-            _, action = _write_python_version(python_version_path, target)
-            typer.echo(f"- {python_version_path}: {action} ({target})")
-        elif apply:
-            unresolved = True
-            typer.echo(
-                f"- {python_version_path}: skipped "
-                f"(drift={python_version_current}, use --allow-existing)"
-            )
-        else:
-            typer.echo(f"- {python_version_path}: drift ({python_version_current})")
-            typer.echo(f"  action: replace with {target}")
-
-    tool_versions_path = Path(".tool-versions")
-    if tool_versions_current is None:
-        if not tool_versions_path.exists() and apply:
-            _, action = _upsert_tool_versions_python(tool_versions_path, target)
-            typer.echo(f"- {tool_versions_path}: {action} (python {target})")
-        elif apply and allow_existing:
-            _, action = _upsert_tool_versions_python(tool_versions_path, target)
-            typer.echo(f"- {tool_versions_path}: {action} (python {target})")
-        elif apply:
-            unresolved = True
-            typer.echo(f"- {tool_versions_path}: skipped (no python entry, use --allow-existing)")
-        else:
-            typer.echo(f"- {tool_versions_path}: missing or no python entry")
-            typer.echo(f"  action: add `python {target}`")
-    elif _same_major_minor(tool_versions_current, target):
-        typer.echo(f"- {tool_versions_path}: aligned (python {tool_versions_current})")
-    else:
-        if apply and allow_existing:
-            _, action = _upsert_tool_versions_python(tool_versions_path, target)
-            typer.echo(f"- {tool_versions_path}: {action} (python {target})")
-        elif apply:
-            unresolved = True
-            typer.echo(
-                f"- {tool_versions_path}: skipped "
-                f"(drift={tool_versions_current}, use --allow-existing)"
-            )
-        else:
-            typer.echo(f"- {tool_versions_path}: drift (python {tool_versions_current})")
-            typer.echo(f"  action: set `python {target}`")
-
-    typer.echo("")
-    if apply:
-        if unresolved:
-            typer.echo(
-                "Reconcile apply completed with skips. Re-run with `--allow-existing` where needed."
-            )
-            raise typer.Exit(code=1)
-        typer.echo("Reconcile apply completed.")
+            if unresolved:
+                out.echo(
+                    "Reconcile apply completed with skips. "
+                    "Re-run with `--allow-existing` where needed."
+                )
+                raise typer.Exit(code=1)
+            out.echo("Reconcile apply completed.")
+            raise typer.Exit(code=0)
+        out.echo("No files were modified. Use `intent reconcile --apply` to apply changes.")
         raise typer.Exit(code=0)
-    typer.echo("No files were modified. Use `intent reconcile --apply` to apply changes.")
-    raise typer.Exit(code=0)
 
 
 @app.command("lint-workflow")
@@ -1777,14 +2063,17 @@ def lint_workflow(
       1 = warnings found in strict mode
       2 = config error
     """
+    from .config import IntentConfigError, load_intent
+    from .render_ci import render_ci
+
     path = Path(intent_path)
     try:
         cfg = load_intent(path)
     except FileNotFoundError as e:
-        typer.echo(f"[{ERR_CONFIG_NOT_FOUND}] Error: {e}", err=True)
+        typer.echo(_CONFIG_NOT_FOUND_PREFIX + str(e), err=True)
         raise typer.Exit(code=2)
     except IntentConfigError as e:
-        typer.echo(f"[{ERR_CONFIG_INVALID}] Config error: {e}", err=True)
+        typer.echo(_CONFIG_INVALID_PREFIX + str(e), err=True)
         raise typer.Exit(code=2)
 
     workflow = render_ci(cfg)
@@ -1828,15 +2117,17 @@ def lint_workflow(
                     }
                 )
 
-    typer.echo("--- lint-workflow ---")
+    with _EchoBuffer() as out:
+        out.echo("--- lint-workflow ---")
+        if not warnings:
+            out.echo("No workflow lint warnings.")
+        for item in warnings:
+            out.echo(f"[{ERR_LINT}] Warning: {item['message']}")
+            out.echo(f"  Fix: {item['fix']}")
+
     if not warnings:
-        typer.echo("No workflow lint warnings.")
         raise typer.Exit(code=0)
 
-    for item in warnings:
-        typer.echo(f"[{ERR_LINT}] Warning: {item['message']}")
-        typer.echo(f"  Fix: {item['fix']}")
-
     if strict:
         raise typer.Exit(code=1)
     raise typer.Exit(code=0)
@@ -1,11 +1,12 @@
 # intent/config.py
 from __future__ import annotations
 
-import tomllib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from . import tomlio
+from .fs import read_file_bytes
 from .versioning import validate_python_version
 
 DEFAULT_CI_INSTALL = "-e .[dev]"
@@ -142,21 +143,23 @@ class IntentConfig:
     ci_summary: CiSummary | None = None
     plugin_check_hooks: list[str] | None = None
     plugin_generate_hooks: list[str] | None = None
+    plugins_parallel: bool = False
     checks_assertions: list[CheckAssertion] | None = None
     checks_gates: list[CheckGate] | None = None
+    checks_parallel: bool = False
     policy_pack: str | None = None
     policy_strict: bool = DEFAULT_POLICY_STRICT
     schema_version: int = DEFAULT_SCHEMA_VERSION
 
 
 def load_raw_intent(path: Path) -> dict:
-    if not path.exists():
-        raise FileNotFoundError(f"{path} does not exist")
-
-    text = path.read_text(encoding="utf-8")
     try:
-        data = tomllib.loads(text)
-    except tomllib.TOMLDecodeError as e:
+        text = read_file_bytes(path).decode("utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{path} does not exist") from None
+    try:
+        data = tomlio.loads(text)
+    except tomlio.TOMLDecodeError as e:
         raise IntentConfigError(f"Invalid TOML in {path}: {e}") from e
 
     python_section = data.get("python")
@@ -243,8 +246,10 @@ def load_intent(path: Path) -> IntentConfig:
     ci_summary: CiSummary | None = None
     plugin_check_hooks: list[str] | None = None
     plugin_generate_hooks: list[str] | None = None
+    plugins_parallel = False
     checks_assertions: list[CheckAssertion] | None = None
     checks_gates: list[CheckGate] | None = None
+    checks_parallel = False
     ci_section = data.get("ci")
     if ci_section is not None:
         if not isinstance(ci_section, dict):
@@ -835,11 +840,21 @@ def load_intent(path: Path) -> IntentConfig:
                     )
                 parsed_generate_hooks.append(raw.strip())
             plugin_generate_hooks = parsed_generate_hooks or None
+        raw_parallel = plugins_section.get("parallel")
+        if raw_parallel is not None:
+            if not isinstance(raw_parallel, bool):
+                raise _field_type_error(path, "[plugins].parallel", "boolean", raw_parallel)
+            plugins_parallel = raw_parallel
 
     checks_section = data.get("checks")
     if checks_section is not None:
         if not isinstance(checks_section, dict):
             raise _field_type_error(path, "[checks]", "table/object", checks_section)
+        raw_checks_parallel = checks_section.get("parallel")
+        if raw_checks_parallel is not None:
+            if not isinstance(raw_checks_parallel, bool):
+                raise _field_type_error(path, "[checks].parallel", "boolean", raw_checks_parallel)
+            checks_parallel = raw_checks_parallel
         raw_assertions = checks_section.get("assertions")
         if raw_assertions is not None:
             if not isinstance(raw_assertions, list):
@@ -1044,8 +1059,10 @@ def load_intent(path: Path) -> IntentConfig:
         ci_summary=ci_summary,
         plugin_check_hooks=plugin_check_hooks,
         plugin_generate_hooks=plugin_generate_hooks,
+        plugins_parallel=plugins_parallel,
         checks_assertions=checks_assertions,
         checks_gates=checks_gates,
+        checks_parallel=checks_parallel,
         policy_pack=policy_pack,
         policy_strict=policy_strict,
     )
@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 import os
-import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
 GENERATED_MARKER = "# GENERATED BY intent"
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
 
 
 @dataclass(frozen=True)
@@ -37,21 +37,70 @@ def _strip_generated_header(text: str, marker: str = GENERATED_MARKER) -> str:
     return "\n".join(lines[start:]).strip()
 
 
-def _atomic_write_text(path: Path, content: str, encoding: str = "utf-8") -> None:
+def read_file_bytes(path: Path) -> bytes:
+    """
+    Read a whole file with open + fstat + one sized read.
+
+    Small config files are always slurped in one go. Path.read_bytes() (and even
+    an unbuffered FileIO.read()) add a BufferedReader, an lseek and a trailing
+    zero-byte read on top; here a read that returns exactly st_size bytes is final.
+    """
+    fd = os.open(path, _READ_FLAGS)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        if size and len(data) == size:
+            return data
+        # Unknown size (e.g. procfs), a short read, or the file grew: read to EOF.
+        chunks = [data]
+        while data:
+            data = os.read(fd, max(size, 65536))
+            chunks.append(data)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _create_temp_file(directory: Path, mode: int) -> tuple[int, Path]:
+    """
+    Create a unique temp file next to the target and return (fd, path).
+
+    The file is opened with the given mode so the kernel applies the process
+    umask itself; nothing here reads or changes the (process-global) umask.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0)
+    while True:
+        tmp_path = directory / f".intent.{os.urandom(6).hex()}"
+        try:
+            return os.open(tmp_path, flags, mode), tmp_path
+        except FileExistsError:
+            continue
+
+
+def atomic_write_text(path: Path, content: str, encoding: str = "utf-8") -> None:
     """
     Write content atomically: write to a temp file in the same directory, then replace.
     This avoids partially-written files if the process is interrupted.
+
+    Symlinks are followed, so the link's target is updated and the link stays a
+    link. An existing file keeps its permissions; a new one gets 0666 minus umask.
     """
-    directory = path.parent
+    target = Path(os.path.realpath(path))
+    directory = target.parent
     directory.mkdir(parents=True, exist_ok=True)
 
-    fd, tmp_name = tempfile.mkstemp(prefix=".intent.", dir=str(directory))
-    tmp_path = Path(tmp_name)
+    try:
+        existing_mode: int | None = target.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        existing_mode = None
 
+    fd, tmp_path = _create_temp_file(directory, 0o666)
     try:
         with os.fdopen(fd, "w", encoding=encoding, newline="\n") as f:
             f.write(content)
-        os.replace(tmp_path, path)  # atomic on POSIX when same filesystem
+        if existing_mode is not None:
+            os.chmod(tmp_path, existing_mode)
+        os.replace(tmp_path, target)  # atomic on POSIX when same filesystem
     finally:
         if tmp_path.exists():
             try:
@@ -81,26 +130,27 @@ def write_generated_file(
     if marker not in content:
         raise ValueError(f"Refusing to write {path}: generated content missing marker {marker!r}")
 
-    if path.exists():
+    try:
         existing = path.read_text(encoding="utf-8")
-        if not _is_tool_owned(existing, marker=marker):
-            if mode == "strict":
+    except FileNotFoundError:
+        atomic_write_text(path, content)
+        return True
+
+    if not _is_tool_owned(existing, marker=marker):
+        if mode == "strict":
+            raise OwnershipError(
+                path=path,
+                message=f"Refusing to overwrite: file is not marked as generated ({marker})",
+            )
+        if mode == "adopt":
+            existing_body = _strip_generated_header(existing, marker=marker)
+            generated_body = _strip_generated_header(content, marker=marker)
+            if existing_body != generated_body:
                 raise OwnershipError(
                     path=path,
-                    message=f"Refusing to overwrite: file is not marked as generated ({marker})",
+                    message="Refusing to adopt: existing content differs (use --force)",
                 )
-            if mode == "adopt":
-                existing_body = _strip_generated_header(existing, marker=marker)
-                generated_body = _strip_generated_header(content, marker=marker)
-                if existing_body != generated_body:
-                    raise OwnershipError(
-                        path=path,
-                        message="Refusing to adopt: existing content differs (use --force)",
-                    )
-        if existing == content:
-            return False
-        _atomic_write_text(path, content)
-        return True
-
-    _atomic_write_text(path, content)
+    if existing == content:
+        return False
+    atomic_write_text(path, content)
     return True
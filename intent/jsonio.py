@@ -0,0 +1,74 @@
+# intent/jsonio.py
+from __future__ import annotations
+
+import json
+import math
+import re
+from json import JSONDecodeError
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional: pip install "intent-cli[speedups]"
+    orjson = None
+
+__all__ = ["JSONDecodeError", "dumps", "dumps_bytes", "loads"]
+
+# orjson turns integers outside the 64-bit range into floats; any such literal
+# has at least 19 digits, so documents containing one are parsed by json instead.
+_LONG_DIGITS_RE = re.compile(r"\d{19,}")
+_LONG_DIGITS_BYTES_RE = re.compile(rb"\d{19,}")
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse JSON text, using orjson when it is installed.
+
+    Results match json.loads either way: documents orjson rejects (NaN/Infinity,
+    a UTF-8 BOM, out-of-range floats) are retried with json.loads, and documents
+    with very long digit runs skip orjson so big integers keep full precision.
+    Only JSONDecodeError from this module needs catching (json.loads may also
+    raise UnicodeDecodeError for undecodable bytes).
+    """
+    if orjson is not None:
+        long_digits = _LONG_DIGITS_BYTES_RE if isinstance(data, bytes) else _LONG_DIGITS_RE
+        if long_digits.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize to compact, ASCII-only JSON, using orjson when it is installed.
+
+    Payloads orjson rejects (e.g. integers beyond 64 bits), that contain
+    non-ASCII text, or that hold NaN/Infinity (which orjson writes as null) go
+    through the stdlib encoder with the same separators.
+    """
+    return dumps_bytes(obj).decode("ascii")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Like dumps(), but return the encoded bytes ready for a binary stream."""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj)
+        except TypeError:
+            pass
+        else:
+            if data.isascii() and not (b"null" in data and _has_non_finite(obj)):
+                return data
+    return json.dumps(obj, separators=(",", ":")).encode("ascii")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(item) for item in obj)
+    return False
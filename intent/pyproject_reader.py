@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import tomllib
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
+from . import tomlio
+from .fs import read_file_bytes
+
 
 class PyprojectPythonStatus(Enum):
     OK = "ok"
@@ -19,15 +22,36 @@ def read_pyproject_python(
     """
     Read the [project].requires-python string from pyproject.toml.
 
+    Results are cached per resolved path and file stat (inode, size, mtime and
+    ctime), so repeated reads within one invocation parse the file only once.
+    A rewrite always changes ctime (and atomic_write_text also the inode), so
+    even a same-size edit within the mtime granularity is re-read.
+
     Returns:
         (status, value)
     """
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return PyprojectPythonStatus.FILE_MISSING, None
+    return _read_pyproject_python_cached(
+        path.resolve(), st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns
+    )
 
+
+@lru_cache(maxsize=8)
+def _read_pyproject_python_cached(
+    path: Path,
+    ino: int,
+    size: int,
+    mtime_ns: int,
+    ctime_ns: int,
+) -> tuple[PyprojectPythonStatus, str | None]:
     try:
-        data = tomllib.loads(path.read_text(encoding="utf-8"))
-    except tomllib.TOMLDecodeError:
+        data = tomlio.loads(read_file_bytes(path).decode("utf-8"))
+    except FileNotFoundError:
+        return PyprojectPythonStatus.FILE_MISSING, None
+    except tomlio.TOMLDecodeError:
         return PyprojectPythonStatus.INVALID, None
     project = data.get("project")
     if not isinstance(project, dict):
@@ -0,0 +1,36 @@
+# intent/tomlio.py
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import rtoml
+except ImportError:  # optional: pip install "intent-cli[speedups]"
+    rtoml = None
+
+__all__ = ["TOMLDecodeError", "loads"]
+
+
+class TOMLDecodeError(ValueError):
+    """Raised for invalid TOML, whichever parser handled it."""
+
+
+def loads(text: str) -> dict[str, Any]:
+    """
+    Parse TOML text, using the native rtoml parser when it is installed.
+
+    Falls back to the stdlib tomllib. Both parsers' errors are re-raised as
+    TOMLDecodeError from this module.
+    """
+    if rtoml is not None:
+        try:
+            return rtoml.loads(text)
+        except rtoml.TomlParsingError as e:
+            raise TOMLDecodeError(str(e)) from e
+
+    import tomllib
+
+    try:
+        return tomllib.loads(text)
+    except tomllib.TOMLDecodeError as e:
+        raise TOMLDecodeError(str(e)) from e
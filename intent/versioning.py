@@ -1,10 +1,14 @@
 # intent/versioning.py
 from __future__ import annotations
 
-from packaging.specifiers import InvalidSpecifier, SpecifierSet
-from packaging.version import InvalidVersion, Version
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from packaging.version import Version
 
+
+@lru_cache(maxsize=256)
 def parse_version(version: str) -> tuple[int, ...] | None:
     """
     Parse a version string like:
@@ -39,7 +43,10 @@ def validate_python_version(raw: str) -> None:
         raise ValueError(f"Invalid python version {raw!r} (expected like '3.12')")
 
 
+@lru_cache(maxsize=256)
 def parse_pep440_version(raw: str) -> Version | None:
+    from packaging.version import InvalidVersion, Version
+
     raw = raw.strip()
     if not raw:
         return None
@@ -49,6 +56,7 @@ def parse_pep440_version(raw: str) -> Version | None:
         return None
 
 
+@lru_cache(maxsize=128)
 def max_lower_bound(spec: str) -> Version | None:
     """
     Return the largest lower bound found in a spec string.
@@ -56,6 +64,9 @@ def max_lower_bound(spec: str) -> Version | None:
       ">=3.10,>=3.12,<3.13" -> Version("3.12")
       ">3.11,<3.13" -> Version("3.11")
     """
+    from packaging.specifiers import InvalidSpecifier, SpecifierSet
+    from packaging.version import InvalidVersion, Version
+
     try:
         spec_set = SpecifierSet(spec)
     except InvalidSpecifier:
@@ -86,6 +97,8 @@ def check_requires_python_range(intent_version: str, spec: str) -> bool | None:
       False -> intent_version does NOT satisfy the spec
       None  -> unsupported/unknown spec pattern
     """
+    from packaging.specifiers import InvalidSpecifier, SpecifierSet
+
     intent_parsed = parse_pep440_version(intent_version)
     if intent_parsed is None:
         return None
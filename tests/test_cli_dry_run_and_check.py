@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import json
+import shutil
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
-from intent.cli import app
+from intent.cli import _EchoBuffer, _run_shell, app
 from intent.config import load_intent
 from intent.render_ci import render_ci
 from intent.render_just import render_just
@@ -56,6 +58,31 @@ def test_sync_missing_intent_shows_init_fix_hint(tmp_path: Path, monkeypatch) ->
     assert "Fix: run `intent init` to create a starter config." in result.output
 
 
+def test_sync_loads_intent_once(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        test = "pytest -q"
+        """,
+    )
+    calls: list[Path] = []
+
+    def counting_load_intent(path: Path):
+        calls.append(path)
+        return load_intent(path)
+
+    monkeypatch.setattr("intent.config.load_intent", counting_load_intent)
+
+    result = runner.invoke(app, ["sync"])
+    assert result.exit_code == 0
+    assert len(calls) == 1
+
+
 def test_check_fails_when_generated_files_missing(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.chdir(tmp_path)
     write_intent(
@@ -474,6 +501,38 @@ def test_check_json_output_includes_assertion_failures(tmp_path: Path, monkeypat
     assert data["checks"][0]["code"] == "INTENT401"
 
 
+def test_check_reports_command_output_that_is_not_json(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "text.out").write_text("not json", encoding="utf-8")
+    (tmp_path / "binary.out").write_bytes(b"\xff\xfe{")
+    intent_path = write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        text = "cat text.out"
+        binary = "cat binary.out"
+
+        [checks]
+        assertions = [
+          { command = "text", path = "a", op = "eq", value = 1 },
+          { command = "binary", path = "a", op = "eq", value = 1 },
+        ]
+        """,
+    )
+    write_synced_generated_files(tmp_path, intent_path)
+
+    result = runner.invoke(app, ["check", "--format", "json"])
+    assert result.exit_code == 1
+    data = json.loads(result.output)
+    assert [item["reason"].startswith("stdout is not valid JSON") for item in data["checks"]] == [
+        True,
+        True,
+    ]
+
+
 def test_check_json_output_includes_summary_metrics_delta(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.chdir(tmp_path)
     (tmp_path / "metrics.json").write_text(
@@ -969,3 +1028,171 @@ def test_sync_write_runs_plugin_generate_hooks_and_fails_on_error(
     assert "[INTENT301]" in result.output
     assert "plugin generate failed (9)" in result.output
     assert "stderr: gen-bad" in result.output
+
+
+def test_check_treats_crlf_generated_files_as_up_to_date(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    intent_path = write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        test = "pytest -q"
+        """,
+    )
+    cfg = load_intent(intent_path)
+    (tmp_path / ".github/workflows").mkdir(parents=True)
+    (tmp_path / ".github/workflows/ci.yml").write_bytes(
+        render_ci(cfg).replace("\n", "\r\n").encode("utf-8")
+    )
+    (tmp_path / "justfile").write_bytes(render_just(cfg).replace("\n", "\r\n").encode("utf-8"))
+
+    result = runner.invoke(app, ["check"])
+    assert result.exit_code == 0
+
+
+def test_check_uses_ascii_marks_on_non_utf8_stdout(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    intent_path = write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        test = "pytest -q"
+        """,
+    )
+    write_synced_generated_files(tmp_path, intent_path)
+
+    result = CliRunner(charset="ascii").invoke(app, ["check"])
+    assert result.exit_code == 0
+    assert "OK .github/workflows/ci.yml is up to date" in result.output
+    assert "✓" not in result.output
+
+
+def test_check_plugin_missing_binary_reports_127(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    intent_path = write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        test = "pytest -q"
+
+        [plugins]
+        check = ["intent-missing-plugin-binary --flag"]
+        """,
+    )
+    write_synced_generated_files(tmp_path, intent_path)
+
+    result = runner.invoke(app, ["check"])
+    assert result.exit_code == 1
+    assert "plugin check failed (127)" in result.output
+
+
+def test_check_fail_fast_skips_plugins_after_drift(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        test = "pytest -q"
+
+        [plugins]
+        check = ["touch plugin-ran"]
+        """,
+    )
+
+    result = runner.invoke(app, ["check", "--fail-fast"])
+    assert result.exit_code == 1
+    assert "[INTENT201]" in result.output
+    assert "intent sync --write" in result.output
+    assert not (tmp_path / "plugin-ran").exists()
+
+    result = runner.invoke(app, ["check"])
+    assert result.exit_code == 1
+    assert (tmp_path / "plugin-ran").exists()
+
+
+def test_check_runs_shared_json_command_once(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "metrics.json").write_text('{"metrics":{"score":0.91}}', encoding="utf-8")
+    intent_path = write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        eval = "cat metrics.json"
+
+        [[checks.assertions]]
+        command = "eval"
+        path = "metrics.score"
+        op = "gte"
+        value = 0.9
+
+        [ci.summary]
+        enabled = true
+
+        [[ci.summary.metrics]]
+        label = "score"
+        command = "eval"
+        path = "metrics.score"
+        """,
+    )
+    write_synced_generated_files(tmp_path, intent_path)
+
+    commands_run: list[str] = []
+
+    def counting_run_shell(command: str, text: bool = True):
+        commands_run.append(command)
+        return _run_shell(command, text)
+
+    monkeypatch.setattr("intent.cli._run_shell", counting_run_shell)
+
+    result = runner.invoke(app, ["check", "--format", "json"])
+    assert result.exit_code == 0
+    assert commands_run == ["cat metrics.json"]
+
+
+def test_run_shell_falls_back_to_sh_for_script_without_shebang(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    script = tmp_path / "check.sh"
+    script.write_text("exit 0\n", encoding="utf-8")
+    script.chmod(0o755)
+
+    assert _run_shell("./check.sh").returncode == 0
+
+
+def test_run_shell_runs_builtins_through_sh() -> None:
+    assert _run_shell("hash").returncode == 0
+    assert _run_shell("intent-missing-plugin-binary --flag").returncode == 127
+
+
+def test_run_shell_keeps_non_blank_whitespace_literal_like_sh() -> None:
+    printf = shutil.which("printf")
+    if printf is None:
+        pytest.skip("printf binary not available")
+
+    assert _run_shell(f"{printf} %s, a\xa0b").stdout == "a\xa0b,"
+    assert _run_shell(f"{printf} %s, a\rb", text=False).stdout == b"a\rb,"
+
+
+def test_echo_buffer_extend_with_no_messages_adds_no_blank_line(capsys) -> None:
+    with _EchoBuffer() as out:
+        out.echo("first", err=True)
+        out.extend([])
+        out.echo("second", err=True)
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == "first\nsecond\n"
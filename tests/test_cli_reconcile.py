@@ -204,3 +204,50 @@ def test_reconcile_apply_updates_existing_with_allow_existing(tmp_path: Path, mo
     assert (tmp_path / ".tool-versions").read_text(encoding="utf-8") == "python 3.12\n"
     pyproject = (tmp_path / "pyproject.toml").read_text(encoding="utf-8")
     assert 'requires-python = ">=3.12,<3.13"' in pyproject
+
+
+def test_reconcile_apply_only_touches_project_requires_python(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        test = "pytest -q"
+        """,
+    )
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\nversion = "0.1.0"\n\n'
+        '[tool.example]\nrequires-python = "keep-me"\n',
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(app, ["reconcile", "--apply", "--allow-existing"])
+    assert result.exit_code == 0
+    pyproject = (tmp_path / "pyproject.toml").read_text(encoding="utf-8")
+    assert pyproject.startswith('[project]\nrequires-python = ">=3.12,<3.13"\n')
+    assert 'requires-python = "keep-me"' in pyproject
+
+
+def test_reconcile_apply_preserves_rest_of_pyproject(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        test = "pytest -q"
+        """,
+    )
+    original = '[project]\r\nname = "demo"\r\nrequires-python = ">=3.8"\r\n\r\n[tool.x]\r\na = 1'
+    (tmp_path / "pyproject.toml").write_bytes(original.encode("utf-8"))
+
+    result = runner.invoke(app, ["reconcile", "--apply", "--allow-existing"])
+    assert result.exit_code == 0
+    assert (tmp_path / "pyproject.toml").read_bytes() == original.replace(
+        'requires-python = ">=3.8"', 'requires-python = ">=3.12,<3.13"'
+    ).encode("utf-8")
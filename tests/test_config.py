@@ -556,6 +556,95 @@ def test_load_intent_plugins_generate_rejects_empty_item(tmp_path: Path) -> None
     assert "invalid [plugins].generate[0]" in str(excinfo.value)
 
 
+def test_load_intent_plugins_parallel(tmp_path: Path) -> None:
+    path = write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        test = "pytest -q"
+
+        [plugins]
+        check = ["echo check-1"]
+        parallel = true
+        """,
+    )
+    assert load_intent(path).plugins_parallel is True
+
+
+def test_load_intent_plugins_parallel_rejects_non_bool(tmp_path: Path) -> None:
+    path = write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        test = "pytest -q"
+
+        [plugins]
+        parallel = "yes"
+        """,
+    )
+    with pytest.raises(IntentConfigError) as excinfo:
+        load_intent(path)
+    assert "invalid [plugins].parallel" in str(excinfo.value)
+
+
+def test_load_intent_checks_parallel(tmp_path: Path) -> None:
+    path = write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        test = "pytest -q"
+
+        [checks]
+        parallel = true
+        """,
+    )
+    cfg = load_intent(path)
+    assert cfg.checks_parallel is True
+    assert cfg.plugins_parallel is False
+
+
+def test_load_intent_checks_parallel_defaults_to_serial(tmp_path: Path) -> None:
+    path = write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        test = "pytest -q"
+        """,
+    )
+    assert load_intent(path).checks_parallel is False
+
+
+def test_load_intent_checks_parallel_rejects_non_bool(tmp_path: Path) -> None:
+    path = write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        test = "pytest -q"
+
+        [checks]
+        parallel = 1
+        """,
+    )
+    with pytest.raises(IntentConfigError) as excinfo:
+        load_intent(path)
+    assert "invalid [checks].parallel" in str(excinfo.value)
+
+
 def test_load_intent_ci_jobs_valid(tmp_path: Path) -> None:
     path = write_intent(
         tmp_path,
@@ -750,3 +839,18 @@ def test_load_intent_ci_summary_baseline_file_requires_path(tmp_path: Path) -> N
     with pytest.raises(IntentConfigError) as excinfo:
         load_intent(path)
     assert "[ci].summary.baseline.file is required when source='file'" in str(excinfo.value)
+
+
+def test_load_intent_returns_independent_configs(tmp_path: Path) -> None:
+    path = write_intent(
+        tmp_path,
+        """
+        [python]
+        version = "3.12"
+
+        [commands]
+        test = "pytest -q"
+        """,
+    )
+    load_intent(path).commands["x"] = "y"
+    assert "x" not in load_intent(path).commands
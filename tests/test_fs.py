@@ -1,4 +1,5 @@
 # test_fs.py
+import os
 from pathlib import (
     Path,
 )
@@ -8,6 +9,8 @@ import pytest
 from intent.fs import (
     GENERATED_MARKER,
     OwnershipError,
+    atomic_write_text,
+    read_file_bytes,
     write_generated_file,
 )
 
@@ -144,3 +147,56 @@ def test_write_generated_file_force_overwrites_user_owned_file(tmp_path: Path) -
     changed = write_generated_file(path, content, mode="force")
     assert changed is True
     assert path.read_text(encoding="utf-8") == content
+
+
+def test_read_file_bytes_returns_exact_contents(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_bytes(b"line one\r\nline two\n")
+
+    assert read_file_bytes(path) == b"line one\r\nline two\n"
+    (tmp_path / "empty.txt").write_bytes(b"")
+    assert read_file_bytes(tmp_path / "empty.txt") == b""
+    with pytest.raises(FileNotFoundError):
+        read_file_bytes(tmp_path / "missing.txt")
+
+
+def test_atomic_write_text_keeps_existing_permissions(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "pyproject.toml"
+    path.write_text("old\n", encoding="utf-8")
+    path.chmod(0o640)
+
+    atomic_write_text(path, "new\n")
+
+    assert path.read_text(encoding="utf-8") == "new\n"
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["pyproject.toml"]
+
+
+def test_atomic_write_text_follows_symlinks(
+    tmp_path: Path,
+) -> None:
+    target = tmp_path / "dotfiles" / "tool-versions"
+    target.parent.mkdir()
+    target.write_text("python 3.11\n", encoding="utf-8")
+    link = tmp_path / ".tool-versions"
+    link.symlink_to(target)
+
+    atomic_write_text(link, "python 3.12\n")
+
+    assert link.is_symlink()
+    assert target.read_text(encoding="utf-8") == "python 3.12\n"
+
+
+def test_atomic_write_text_new_file_honours_umask(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / ".python-version"
+    old_umask = os.umask(0o027)
+    try:
+        atomic_write_text(path, "3.12\n")
+    finally:
+        os.umask(old_umask)
+
+    assert path.stat().st_mode & 0o777 == 0o640
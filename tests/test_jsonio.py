@@ -0,0 +1,65 @@
+# test_jsonio.py
+import json
+
+import pytest
+
+from intent import jsonio
+
+
+def test_dumps_is_compact_and_round_trips() -> None:
+    payload = {"ok": True, "items": [1, 2.5, None], "nested": {"name": "demo"}}
+    out = jsonio.dumps(payload)
+    assert out == '{"ok":true,"items":[1,2.5,null],"nested":{"name":"demo"}}'
+    assert jsonio.loads(out) == payload
+
+
+def test_dumps_escapes_non_ascii() -> None:
+    out = jsonio.dumps({"label": "café ✓"})
+    assert out.isascii()
+    assert json.loads(out) == {"label": "café ✓"}
+
+
+def test_dumps_handles_large_integers() -> None:
+    assert jsonio.dumps({"n": 2**70}) == '{"n":1180591620717411303424}'
+
+
+def test_loads_raises_json_decode_error() -> None:
+    with pytest.raises(jsonio.JSONDecodeError):
+        jsonio.loads("{not json")
+
+
+def test_dumps_bytes_matches_dumps() -> None:
+    payload = {"ok": False, "label": "café"}
+    assert jsonio.dumps_bytes(payload) == jsonio.dumps(payload).encode("ascii")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"18446744073709551616",
+        b"-9223372036854775809",
+        b'{"score": NaN, "max": Infinity}',
+        b"\xef\xbb\xbf{}",
+        b"[1e400]",
+    ],
+)
+def test_loads_matches_stdlib_with_orjson(data: bytes) -> None:
+    pytest.importorskip("orjson")
+    result = jsonio.loads(data)
+    expected = json.loads(data)
+    assert repr(result) == repr(expected)
+    assert type(result) is type(expected)
+
+
+def test_loads_with_orjson_still_raises_json_decode_error() -> None:
+    pytest.importorskip("orjson")
+    with pytest.raises(jsonio.JSONDecodeError):
+        jsonio.loads(b"{not json")
+
+
+def test_dumps_keeps_non_finite_floats_with_orjson() -> None:
+    pytest.importorskip("orjson")
+    payload = {"metrics": [{"value": float("nan")}, float("inf"), -float("inf")], "code": None}
+    expected = json.dumps(payload, separators=(",", ":"))
+    assert jsonio.dumps(payload) == expected
+    assert jsonio.dumps_bytes(payload) == expected.encode("ascii")
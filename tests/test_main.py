@@ -0,0 +1,25 @@
+# test_main.py
+from __future__ import annotations
+
+import sys
+
+from intent import __main__, __version__
+
+
+def test_version_is_answered_without_the_cli(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(sys, "argv", ["intent", "--version"])
+    monkeypatch.setattr("intent.cli.main", lambda: (_ for _ in ()).throw(AssertionError))
+
+    __main__.main()
+
+    assert capsys.readouterr().out == f"{__version__}\n"
+
+
+def test_other_arguments_are_dispatched_to_the_cli(monkeypatch) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(sys, "argv", ["intent", "check", "--version"])
+    monkeypatch.setattr("intent.cli.main", lambda: calls.append(sys.argv[1:]))
+
+    __main__.main()
+
+    assert calls == [["check", "--version"]]
@@ -1,4 +1,5 @@
 # test_pyproject_reader.py
+import os
 from pathlib import Path
 
 from intent.pyproject_reader import PyprojectPythonStatus, read_pyproject_python
@@ -72,3 +73,35 @@ def test_read_pyproject_python_invalid_toml(tmp_path: Path) -> None:
     status, value = read_pyproject_python(path)
     assert status is PyprojectPythonStatus.INVALID
     assert value is None
+
+
+def test_read_pyproject_python_picks_up_file_changes(tmp_path: Path) -> None:
+    path = write_project(
+        tmp_path,
+        """
+        [project]
+        requires-python = ">=3.12"
+        """,
+    )
+    assert read_pyproject_python(path) == (PyprojectPythonStatus.OK, ">=3.12")
+
+    write_project(
+        tmp_path,
+        """
+        [project]
+        requires-python = ">=3.10,<3.13"
+        """,
+    )
+    assert read_pyproject_python(path) == (PyprojectPythonStatus.OK, ">=3.10,<3.13")
+
+
+def test_read_pyproject_python_rereads_same_size_rewrite_with_same_mtime(tmp_path: Path) -> None:
+    path = write_project(tmp_path, '[project]\nrequires-python = ">=3.11"\n')
+    assert read_pyproject_python(path) == (PyprojectPythonStatus.OK, ">=3.11")
+    st = path.stat()
+
+    path.write_text('[project]\nrequires-python = ">=3.12"\n', encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert path.stat().st_size == st.st_size
+
+    assert read_pyproject_python(path) == (PyprojectPythonStatus.OK, ">=3.12")
@@ -0,0 +1,14 @@
+# test_tomlio.py
+import pytest
+
+from intent import tomlio
+
+
+def test_loads_parses_tables() -> None:
+    data = tomlio.loads('[python]\nversion = "3.12"\n\n[commands]\ntest = "pytest -q"\n')
+    assert data == {"python": {"version": "3.12"}, "commands": {"test": "pytest -q"}}
+
+
+def test_loads_raises_toml_decode_error() -> None:
+    with pytest.raises(tomlio.TOMLDecodeError):
+        tomlio.loads("[python\nversion =")
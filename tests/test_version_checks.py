@@ -1,5 +1,6 @@
 # test_version_checks.py
 
+from intent.cli import _evaluate_spec
 from intent.config import IntentConfig
 from intent.render_ci import render_ci
 from intent.versioning import check_requires_python_range, parse_version
@@ -43,6 +44,16 @@ def test_check_requires_python_range_packaging_specifiers() -> None:
     assert _check_requires_python_range("3.12", "<=3.12") is True
 
 
+def test_evaluate_spec_simple_spec_matches() -> None:
+    assert _evaluate_spec("3.12", "3.12", False) == (
+        True,
+        "pyproject requires_python matches intent (3.12)",
+        None,
+    )
+    assert _evaluate_spec("3.12.0", "3.12", False)[0] is True
+    assert _evaluate_spec("3.11", "3.12", False)[0] is False
+
+
 def test_render_ci_contains_header_and_structure() -> None:
     cfg = IntentConfig(python_version="3.12", commands={"test": "pytest -q"})
 